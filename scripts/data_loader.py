@@ -1,7 +1,247 @@
+import functools
+import hashlib
+import logging
+import os
 import warnings
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+try:
+    import polars as pl
+except ImportError:  # Polars is optional and only needed by the scan/collect methods
+    pl = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; pd.to_numeric is used without it
+    njit = None
+
+log = logging.getLogger(__name__)
+
+# Column types of the CSV emitted by DataLogger. Declaring them up front lets the
+# Arrow reader skip type inference and convert each column in a single pass.
+CSV_COLUMN_TYPES = {
+    'Timestamp': pa.timestamp('ns'),
+    'Operation': pa.dictionary(pa.int32(), pa.string()),
+    'BlockSize': pa.int64(),
+    'Time': pa.float64(),
+    'Fragmentation': pa.float64(),
+    'Source': pa.dictionary(pa.int32(), pa.string()),
+    'CallStack': pa.dictionary(pa.int32(), pa.string()),
+    'MemoryAddress': pa.dictionary(pa.int32(), pa.string()),
+    'ThreadID': pa.dictionary(pa.int32(), pa.string()),
+    'AllocationID': pa.string(),
+}
+
+# CSV_COLUMN_TYPES with the timestamp and numerical columns read as strings, used when
+# malformed values make the typed read fail.
+LENIENT_COLUMN_TYPES = {
+    **CSV_COLUMN_TYPES,
+    'Timestamp': pa.string(),
+    'BlockSize': pa.string(),
+    'Time': pa.string(),
+    'Fragmentation': pa.string(),
+}
+
+# DataLogger writes "YYYY-MM-DD HH:MM:SS"; ISO 8601 also covers fractional seconds.
+TIMESTAMP_PARSERS = ['%Y-%m-%d %H:%M:%S', pacsv.ISO8601]
+
+# Target dtypes applied by preprocess_data in a single astype call. Low-cardinality keys are
+# categoricals so group-bys run on their integer codes, and MemoryAddress is dictionary
+# encoded because the pool hands the same addresses out over and over. CallStack is factorized
+# the same way: a trace repeats a handful of long stack strings, so frequency counts become a
+# bincount over integer codes instead of hashing every string. The near-unique AllocationID
+# uses Arrow-backed strings, which are far smaller than Python str objects and vectorize.
+PREPROCESS_DTYPES = {
+    'Operation': 'category',
+    'ThreadID': 'category',
+    'Source': 'category',
+    'MemoryAddress': 'category',
+    'AllocationID': pd.StringDtype('pyarrow'),
+    'CallStack': 'category',
+}
+
+NUMERIC_COLUMNS = ['BlockSize', 'Time', 'Fragmentation']
+
+# chrono format used by the Polars engine; "%.f" also accepts timestamps without fractions.
+POLARS_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S%.f'
+
+# Bump whenever preprocess_data changes its output so stale Parquet caches are ignored.
+CACHE_VERSION = 6
+
+# Parquet schema metadata key recording which CSV version and columns a cache file holds.
+CACHE_STAMP_KEY = b'memviz.source_stamp'
+
+# Arrow's default block size is 1 MiB; larger blocks mean fewer, bigger parse tasks.
+READ_BLOCK_SIZE = 8 << 20
+
+
+def _include_columns(columns: Optional[Iterable[str]]) -> list:
+    """
+    Returns the Arrow include_columns list for a column selection, in CSV order.
+
+    Arrow reads an empty include_columns as "all columns", so a selection that names none of
+    the CSV columns raises ValueError instead of silently loading everything.
+    """
+    if columns is None:
+        return []
+    include_columns = [col for col in CSV_COLUMN_TYPES if col in columns]
+    if not include_columns:
+        raise ValueError(f"No CSV columns selected (got {sorted(columns)})")
+    return include_columns
+
+
+def _skip_trailing_empty_fields(row: pacsv.InvalidRow) -> str:
+    """
+    Arrow invalid_row_handler that skips rows whose only surplus fields are empty.
+
+    DataLogger::logSummary ends its rows with a trailing comma, one field more than the
+    header. The streamed plots ignore summary rows, so those rows are skipped rather than
+    failing the stream; any other malformed row is still reported as an error.
+    """
+    surplus = row.actual_columns - row.expected_columns
+    if surplus > 0 and row.text is not None and row.text.rstrip('\r\n').endswith(',' * surplus):
+        return 'skip'
+    return 'error'
+
+
+def _arrow_types_mapper(arrow_type: pa.DataType) -> Optional[pd.api.extensions.ExtensionDtype]:
+    """
+    Maps Arrow strings to Arrow-backed pandas strings when converting tables to pandas.
+
+    Every other type keeps pyarrow's default conversion (NumPy numerics and datetimes,
+    categoricals for dictionary columns).
+    """
+    if arrow_type == pa.string() or arrow_type == pa.large_string():
+        return pd.StringDtype('pyarrow')
+    return None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _parse_float_buffer(data, offsets, out):  # pragma: no cover - compiled by Numba
+        """
+        Parses the UTF-8 strings of an Arrow string array into float64, NaN on bad input.
+
+        Accepts an optional sign, digits with an optional fraction and an optional
+        exponent, surrounded by spaces.
+        """
+        for i in prange(out.shape[0]):
+            pos = offsets[i]
+            end = offsets[i + 1]
+            while pos < end and data[pos] == 32:
+                pos += 1
+            while end > pos and data[end - 1] == 32:
+                end -= 1
+
+            negative = False
+            if pos < end and (data[pos] == 43 or data[pos] == 45):
+                negative = data[pos] == 45
+                pos += 1
+
+            mantissa = 0.0
+            scale = 0
+            digits = 0
+            while pos < end and 48 <= data[pos] <= 57:
+                mantissa = mantissa * 10.0 + (data[pos] - 48)
+                digits += 1
+                pos += 1
+            if pos < end and data[pos] == 46:
+                pos += 1
+                while pos < end and 48 <= data[pos] <= 57:
+                    mantissa = mantissa * 10.0 + (data[pos] - 48)
+                    scale -= 1
+                    digits += 1
+                    pos += 1
+
+            valid = digits > 0
+            if valid and pos < end and (data[pos] == 101 or data[pos] == 69):
+                pos += 1
+                exp_negative = False
+                if pos < end and (data[pos] == 43 or data[pos] == 45):
+                    exp_negative = data[pos] == 45
+                    pos += 1
+                exponent = 0
+                exp_digits = 0
+                while pos < end and 48 <= data[pos] <= 57:
+                    exponent = exponent * 10 + (data[pos] - 48)
+                    exp_digits += 1
+                    pos += 1
+                valid = exp_digits > 0
+                scale += -exponent if exp_negative else exponent
+
+            if not valid or pos != end:
+                out[i] = np.nan
+                continue
+            # Not correctly rounded in general: the result is exact to half an ulp only while the
+            # mantissa stays below 2**53 and |scale| <= 22 (10**scale is then exact). Longer
+            # mantissas round on every extra digit and larger powers of ten are inexact, so the
+            # error grows to a few ulps, well within 1e-12 relative, which is ample for
+            # latencies and fragmentation ratios
+            value = mantissa / 10.0 ** -scale if scale < 0 else mantissa * 10.0 ** scale
+            out[i] = -value if negative else value
+else:
+    _parse_float_buffer = None
+
+
+def _coerce_numeric(series: pd.Series) -> pd.Series:
+    """
+    Converts a column of numeric strings to float64, with NaN for unparsable values.
+
+    Arrow-backed string columns are parsed straight from their byte buffers by a
+    parallel Numba kernel when Numba is installed; anything else uses pd.to_numeric.
+    """
+    if _parse_float_buffer is None or not (
+            isinstance(series.dtype, pd.StringDtype) and series.dtype.storage == 'pyarrow'):
+        return pd.to_numeric(series, errors='coerce')
+
+    arr = pa.array(series.array)
+    offset_type = np.int64 if pa.types.is_large_string(arr.type) else np.int32
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=offset_type)[arr.offset:arr.offset + len(arr) + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8) if data_buf is not None else np.zeros(0, np.uint8)
+
+    out = np.empty(len(arr), dtype=np.float64)
+    _parse_float_buffer(data, offsets, out)
+    if arr.null_count:
+        out[arr.is_null().to_numpy(zero_copy_only=False)] = np.nan
+    return pd.Series(out, index=series.index, name=series.name)
+
+
+def _narrow_numeric(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """
+    Downcasts BlockSize to the smallest signed integer type and Time to float32.
+
+    Halving the width halves the memory traffic of the bandwidth-bound cumsum, histogram
+    and group-by passes in the Visualizer. BlockSize stays signed so it can be negated for
+    deallocations; float32 keeps about seven significant digits of the latencies and
+    summary throughputs, which is far beyond what a plot resolves.
+    """
+    if 'BlockSize' in columns and pd.api.types.is_numeric_dtype(df['BlockSize']):
+        df['BlockSize'] = pd.to_numeric(df['BlockSize'], downcast='integer')
+    if 'Time' in columns and pd.api.types.is_float_dtype(df['Time']):
+        df['Time'] = df['Time'].astype(np.float32)
+    return df
+
+
+# A single entry serves repeated loads of the same CSV (e.g. in a notebook) without pinning
+# earlier DataFrames in memory while a batch run moves on to the next file.
+@functools.lru_cache(maxsize=1)
+def _load_preprocessed_memoized(file_path: str, mtime_ns: int, size: int, cache_dir: Optional[str],
+                                columns: Optional[frozenset]) -> Optional[pd.DataFrame]:
+    """
+    Memoizes DataLoader._load_and_cache per CSV version.
+
+    lru_cache cannot key bound methods on file state, so the modification time and size
+    are explicit arguments: a changed CSV produces a new key.
+    """
+    return DataLoader(file_path, cache_dir)._load_and_cache(columns)
 
 
 class DataLoader:
@@ -12,16 +252,41 @@ class DataLoader:
     ----------
     file_path : str
         The path to the CSV file containing performance data.
+    cache_dir : Optional[str]
+        Directory holding Parquet caches of preprocessed data, or None to disable caching.
 
     Methods
     -------
-    load_data() -> pd.DataFrame
+    load_data(columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]
         Loads data from the CSV file into a pandas DataFrame.
-    preprocess_data(df: pd.DataFrame) -> pd.DataFrame
+    load_preprocessed(columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]
+        Loads and preprocesses the data, reusing a fresh Parquet cache when available.
+    link_cache(columns: Optional[Iterable[str]], path: str) -> bool
+        Hard-links the up-to-date Parquet cache of the data to path.
+    read_parquet(path: str) -> pd.DataFrame
+        Reads a preprocessed DataFrame from a Parquet file.
+    preprocess_data(df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame
         Cleans and preprocesses the DataFrame.
+    iter_batches(columns: Optional[Iterable[str]] = None, block_size: int = READ_BLOCK_SIZE)
+        Streams the CSV as typed Arrow record batches, cleaned like preprocess_data.
+    scan_data(columns: Optional[Iterable[str]] = None) -> pl.LazyFrame
+        Builds a lazy Polars query that loads and cleans only the requested columns.
+    collect_frame(columns: Optional[Iterable[str]] = None) -> Optional[pl.DataFrame]
+        Runs the Polars query and returns the cleaned Polars DataFrame.
+    collect_data(columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]
+        Runs the Polars query and returns the preprocessed pandas DataFrame.
+    frame_to_pandas(frame: pl.DataFrame) -> pd.DataFrame
+        Converts a collected Polars frame to pandas with the preprocess_data dtypes.
+
+    Notes
+    -----
+    Wherever a ``columns`` selection is accepted, rows are only validated on the selected
+    Timestamp and numerical columns, so the selection changes which malformed rows are
+    dropped. For example, the columns of ``-p call_stack_trace_frequency`` alone keep a row
+    with an unparsable Timestamp that the columns of ``-p all`` discard.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, cache_dir: Optional[str] = None):
         """
         Initializes the DataLoader with the specified file path.
 
@@ -29,33 +294,373 @@ class DataLoader:
         ----------
         file_path : str
             The path to the CSV file containing performance data.
+        cache_dir : Optional[str], default=None
+            Directory for Parquet caches of the preprocessed data. If None, caching is disabled.
         """
         self.file_path = file_path
+        self.cache_dir = cache_dir
 
-    def load_data(self) -> Optional[pd.DataFrame]:
+    def load_data(self, columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
         """
         Loads data from the CSV file into a pandas DataFrame.
 
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]], default=None
+            The columns to decode. Unused columns are skipped by the parser rather than
+            dropped after the fact. If None, all columns are loaded; a selection naming no
+            CSV column is reported as an error.
+
         Returns
         -------
         Optional[pd.DataFrame]
             The loaded DataFrame, or None if an error occurred.
         """
+        columns = None if columns is None else set(columns)
         try:
-            df = pd.read_csv(self.file_path)
-            print(f"Data loaded successfully from {self.file_path}")
+            try:
+                df = self._read_typed_csv(columns=columns)
+            except pa.ArrowInvalid:
+                # Malformed cells defeat the typed reader; re-read the timestamp and numerical
+                # columns as strings and leave their coercion to preprocess_data. If even that
+                # fails (e.g. an empty file) the pandas parser reports the problem.
+                try:
+                    df = self._read_typed_csv(lenient=True, columns=columns)
+                except pa.ArrowInvalid:
+                    # A usecols callable also makes pandas ignore surplus trailing fields, such
+                    # as those of DataLogger's summary rows, which it rejects without usecols
+                    usecols = (lambda col: True) if columns is None else columns.__contains__
+                    df = pd.read_csv(self.file_path, usecols=usecols)
+            log.info("Data loaded successfully from %s", self.file_path)
             return df
         except FileNotFoundError:
-            print(f"Error: File not found at {self.file_path}")
+            log.error("Error: File not found at %s", self.file_path)
         except pd.errors.EmptyDataError:
-            print(f"Error: File at {self.file_path} is empty")
+            log.error("Error: File at %s is empty", self.file_path)
         except pd.errors.ParserError:
-            print(f"Error: File at {self.file_path} could not be parsed")
+            log.error("Error: File at %s could not be parsed", self.file_path)
         except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+            log.error("An unexpected error occurred: %s", e)
         return None
 
-    def preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def iter_batches(self, columns: Optional[Iterable[str]] = None,
+                     block_size: int = READ_BLOCK_SIZE) -> Iterator[pa.RecordBatch]:
+        """
+        Streams the CSV as typed, cleaned Arrow record batches without loading the whole file.
+
+        Peak memory is bounded by the batch size rather than the file size, which makes
+        reductions over multi-GB traces possible. Rows are cleaned batch by batch as
+        preprocess_data cleans a loaded frame: rows whose decoded timestamp or numerical
+        values are missing or non-finite are dropped. If a malformed value defeats the
+        typed reader, the stream continues with a lenient reader from the first row not yet
+        yielded, coercing malformed values to missing ones; numerical columns read that way
+        are float64. Summary rows written with DataLogger's trailing comma are skipped.
+        Other errors surface while iterating.
+
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]], default=None
+            The columns to decode. If None, all columns are decoded; a selection naming no
+            CSV column raises ValueError.
+        block_size : int, default=READ_BLOCK_SIZE
+            Approximate size in bytes of the CSV block parsed into each batch.
+
+        Yields
+        ------
+        pa.RecordBatch
+            The next batch of typed, valid rows.
+        """
+        rows_read = 0
+        try:
+            for batch in self._open_csv_stream(columns, block_size):
+                rows_read += batch.num_rows
+                yield self._drop_invalid_rows(batch)
+        except pa.ArrowInvalid as e:
+            log.warning("Malformed values in %s (%s); re-reading leniently from row %d",
+                        self.file_path, e, rows_read)
+            skip = rows_read
+            for batch in self._open_csv_stream(columns, block_size, lenient=True):
+                if skip >= batch.num_rows:
+                    skip -= batch.num_rows
+                    continue
+                batch, skip = batch.slice(skip), 0
+                yield self._drop_invalid_rows(self._coerce_lenient_batch(batch))
+
+    def _open_csv_stream(self, columns: Optional[Iterable[str]], block_size: int,
+                         lenient: bool = False) -> pacsv.CSVStreamingReader:
+        """
+        Opens a streaming Arrow CSV reader; see _read_typed_csv for the parameters.
+        """
+        include_columns = _include_columns(columns)
+        return pacsv.open_csv(
+            self.file_path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=block_size),
+            parse_options=pacsv.ParseOptions(invalid_row_handler=_skip_trailing_empty_fields),
+            convert_options=pacsv.ConvertOptions(
+                column_types=LENIENT_COLUMN_TYPES if lenient else CSV_COLUMN_TYPES,
+                timestamp_parsers=TIMESTAMP_PARSERS,
+                include_columns=include_columns
+            )
+        )
+
+    def _coerce_lenient_batch(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """
+        Converts the string timestamp and numerical columns of a lenient batch, with nulls
+        for malformed values, using the same parsers as preprocess_data.
+        """
+        arrays = []
+        for name, array in zip(batch.schema.names, batch.columns):
+            if name == 'Timestamp' or name in NUMERIC_COLUMNS:
+                series = array.to_pandas(types_mapper=_arrow_types_mapper)
+                series = self._parse_timestamps(series) if name == 'Timestamp' else _coerce_numeric(series)
+                array = pa.Array.from_pandas(series)
+            arrays.append(array)
+        return pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+
+    @staticmethod
+    def _drop_invalid_rows(batch: pa.RecordBatch) -> pa.RecordBatch:
+        """
+        Drops the rows of a batch whose timestamp or numerical values are missing or non-finite.
+        """
+        valid = None
+        for name, array in zip(batch.schema.names, batch.columns):
+            if name != 'Timestamp' and name not in NUMERIC_COLUMNS:
+                continue
+            ok = array.is_valid()
+            if pa.types.is_floating(array.type):
+                ok = pc.and_kleene(ok, pc.is_finite(array))
+            valid = ok if valid is None else pc.and_kleene(valid, ok)
+        if valid is None or pc.all(valid).as_py() is not False:
+            return batch
+        return batch.filter(valid)
+
+    def load_preprocessed(self, columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Loads and preprocesses the data, reusing cached results when the CSV is unchanged.
+
+        The most recent result is memoized in-process on the CSV's path, modification time
+        and size, and persisted to the Parquet cache when cache_dir is set. Parquet preserves the
+        categorical, datetime and Arrow string dtypes, so a cache hit skips both parsing and
+        preprocess_data. An edited or replaced CSV, or a different column selection, is parsed
+        again and overwrites the CSV's single cache file.
+
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]], default=None
+            The columns to load and preprocess, forwarded to load_data and preprocess_data.
+            If None, all columns are loaded.
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            The preprocessed DataFrame, or None if the data could not be loaded.
+        """
+        columns = None if columns is None else frozenset(columns)
+        try:
+            st = os.stat(self.file_path)
+        except OSError:
+            return self._load_and_cache(columns)
+
+        df = _load_preprocessed_memoized(os.path.abspath(self.file_path), st.st_mtime_ns, st.st_size,
+                                         self.cache_dir, columns)
+        # A shallow copy keeps callers from adding or dropping columns on the memoized frame
+        return None if df is None else df.copy(deep=False)
+
+    def _load_and_cache(self, columns: Optional[frozenset] = None) -> Optional[pd.DataFrame]:
+        """
+        Loads and preprocesses the data through the Parquet cache.
+
+        Parameters
+        ----------
+        columns : Optional[frozenset], default=None
+            The columns to load and preprocess. If None, all columns are loaded.
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            The preprocessed DataFrame, or None if the data could not be loaded.
+        """
+        cache_path = self._cache_path()
+        stamp = self._cache_stamp(columns)
+        if cache_path is not None and stamp is not None and os.path.exists(cache_path):
+            try:
+                if pq.read_schema(cache_path).metadata.get(CACHE_STAMP_KEY) == stamp:
+                    df = self.read_parquet(cache_path)
+                    log.info("Data loaded from cache %s", cache_path)
+                    return df
+            except Exception as e:
+                log.warning("Ignoring unreadable cache %s: %s", cache_path, e)
+
+        df = self.load_data(columns)
+        if df is None or df.empty:
+            return df
+        df = self.preprocess_data(df, columns=columns)
+
+        if cache_path is not None and stamp is not None and not df.empty:
+            self._write_cache(df, cache_path, stamp)
+        return df
+
+    def _cache_path(self) -> Optional[str]:
+        """
+        Returns the Parquet cache path for the CSV file.
+
+        The path depends only on the CSV's absolute path, so each CSV owns a single cache
+        file that is overwritten whenever its stamp (see _cache_stamp) no longer matches.
+
+        Returns
+        -------
+        Optional[str]
+            The cache path, or None if caching is disabled.
+        """
+        if self.cache_dir is None:
+            return None
+        key = hashlib.blake2b(os.path.abspath(self.file_path).encode(), digest_size=8).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.parquet")
+
+    def _cache_stamp(self, columns: Optional[frozenset] = None) -> Optional[bytes]:
+        """
+        Returns the stamp identifying the current state of the CSV file and column selection.
+
+        Parameters
+        ----------
+        columns : Optional[frozenset], default=None
+            The loaded columns, which are part of the stamp because they decide which columns
+            are kept and which rows are dropped.
+
+        Returns
+        -------
+        Optional[bytes]
+            The stamp stored in the cache file's metadata, or None if the CSV cannot be stat'ed.
+        """
+        try:
+            st = os.stat(self.file_path)
+        except OSError:
+            return None
+        stamp = f"{st.st_mtime_ns}:{st.st_size}:{CACHE_VERSION}"
+        if columns is not None:
+            stamp += ":" + ",".join(sorted(columns))
+        return stamp.encode()
+
+    def link_cache(self, columns: Optional[Iterable[str]], path: str) -> bool:
+        """
+        Hard-links the up-to-date Parquet cache of the preprocessed data to path.
+
+        The link keeps the cached file's contents even if another run later rewrites the
+        cache, so readers of path always see the data load_preprocessed returned, without
+        the cost of writing a copy. The stamp is checked on the link itself, after linking,
+        so a rewrite racing with this call is detected too.
+
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]]
+            The column selection passed to load_preprocessed.
+        path : str
+            The link to create; it must not exist yet.
+
+        Returns
+        -------
+        bool
+            True if path now holds the current cache, False if caching is disabled, the cache
+            is missing or stale, or the link cannot be made (e.g. across file systems).
+        """
+        cache_path = self._cache_path()
+        stamp = self._cache_stamp(None if columns is None else frozenset(columns))
+        if cache_path is None or stamp is None:
+            return False
+        try:
+            os.link(cache_path, path)
+        except OSError:
+            return False
+        try:
+            if pq.read_schema(path).metadata.get(CACHE_STAMP_KEY) == stamp:
+                return True
+        except Exception:
+            pass
+        os.remove(path)
+        return False
+
+    @staticmethod
+    def read_parquet(path: str) -> pd.DataFrame:
+        """
+        Reads a preprocessed DataFrame written by the cache or a snapshot.
+
+        Parameters
+        ----------
+        path : str
+            The Parquet file path.
+
+        Returns
+        -------
+        pd.DataFrame
+            The DataFrame with the same dtypes preprocess_data produces.
+        """
+        return pq.read_table(path).to_pandas(types_mapper=_arrow_types_mapper, self_destruct=True)
+
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, cache_path: str, stamp: bytes) -> None:
+        """
+        Writes the preprocessed DataFrame to the Parquet cache.
+
+        The file is written under a temporary name and renamed into place so concurrent
+        readers never see a partial cache, replacing any older cache of the same CSV.
+        Failures are reported but not fatal.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The preprocessed DataFrame.
+        cache_path : str
+            The destination cache path.
+        stamp : bytes
+            The CSV stamp stored in the file's schema metadata.
+        """
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            table = pa.Table.from_pandas(df)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), CACHE_STAMP_KEY: stamp})
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            log.warning("Could not write cache %s: %s", cache_path, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _read_typed_csv(self, lenient: bool = False,
+                        columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Reads the CSV with the multithreaded Arrow parser using the known column types.
+
+        Strings become Arrow-backed ``string[pyarrow]`` columns, dictionary columns become
+        pandas categoricals and numeric/timestamp columns become regular NumPy columns.
+
+        Parameters
+        ----------
+        lenient : bool, default=False
+            Read the timestamp and numerical columns as strings so malformed values can be
+            coerced to missing values instead of failing the whole read.
+        columns : Optional[Iterable[str]], default=None
+            The columns to decode. If None, all columns are decoded.
+
+        Returns
+        -------
+        pd.DataFrame
+            The typed DataFrame.
+        """
+        include_columns = _include_columns(columns)
+        table = pacsv.read_csv(
+            self.file_path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=READ_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                column_types=LENIENT_COLUMN_TYPES if lenient else CSV_COLUMN_TYPES,
+                timestamp_parsers=TIMESTAMP_PARSERS,
+                include_columns=include_columns
+            )
+        )
+        return table.to_pandas(types_mapper=_arrow_types_mapper, self_destruct=True)
+
+    def preprocess_data(self, df: pd.DataFrame,
+                        columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
         """
         Cleans and preprocesses the DataFrame.
 
@@ -63,67 +668,217 @@ class DataLoader:
         ----------
         df : pd.DataFrame
             The DataFrame to preprocess.
+        columns : Optional[Iterable[str]], default=None
+            The columns the caller reads. Only these are converted and validated; the other
+            columns are passed through as loaded. If None, all columns are preprocessed.
 
         Returns
         -------
         pd.DataFrame
             The preprocessed DataFrame.
         """
-        # Converts 'Timestamp' to datetime using known formats and suppressing parser warnings
-        if 'Timestamp' in df.columns:
+        wanted = set(df.columns) if columns is None else set(columns) & set(df.columns)
+
+        # Converts 'Timestamp' to datetime unless the reader already produced datetimes
+        if 'Timestamp' in wanted and not pd.api.types.is_datetime64_any_dtype(df['Timestamp']):
             df['Timestamp'] = self._parse_timestamps(df['Timestamp'])
 
-        # Converts 'Operation' to categorical
-        df['Operation'] = df['Operation'].astype('category')
+        # Coerces the numerical columns that were not already read as numbers in one batch
+        to_coerce = [col for col in NUMERIC_COLUMNS
+                     if col in wanted and not pd.api.types.is_numeric_dtype(df[col])]
+        if to_coerce:
+            df[to_coerce] = df[to_coerce].apply(_coerce_numeric)
+
+        # Applies the categorical and string dtypes in one pass
+        dtype_map = {col: dtype for col, dtype in PREPROCESS_DTYPES.items() if col in wanted}
+        df = df.astype(dtype_map, copy=False)
 
-        # Ensures numerical columns are of correct data type
-        df['BlockSize'] = pd.to_numeric(df['BlockSize'], errors='coerce')
-        df['Time'] = pd.to_numeric(df['Time'], errors='coerce')
-        df['Fragmentation'] = pd.to_numeric(df['Fragmentation'], errors='coerce')
+        # Drops rows whose timestamp or numerical values failed conversion. Only the coerced
+        # columns are checked (summary rows legitimately leave the ID columns empty), and the
+        # rows are gathered once by position instead of via dropna + reset_index copies.
+        mask = np.ones(len(df), dtype=bool)
+        if 'Timestamp' in wanted:
+            mask &= df['Timestamp'].notna().to_numpy()
+        for col in NUMERIC_COLUMNS:
+            if col in wanted:
+                mask &= np.isfinite(df[col].to_numpy(dtype=np.float64, na_value=np.nan))
+        if not mask.all():
+            df = df.take(np.flatnonzero(mask)).reset_index(drop=True)
 
-        # Converts 'MemoryAddress' to string (in case it's read as numeric)
-        df['MemoryAddress'] = df['MemoryAddress'].astype(str)
+        df = _narrow_numeric(df, wanted)
 
-        # Converts 'ThreadID' to categorical
-        df['ThreadID'] = df['ThreadID'].astype('category')
+        log.info("Data preprocessing completed.")
+        return df
 
-        # Converts 'AllocationID' to string
-        df['AllocationID'] = df['AllocationID'].astype(str)
+    def scan_data(self, columns: Optional[Iterable[str]] = None) -> 'pl.LazyFrame':
+        """
+        Builds a lazy Polars query that loads and cleans the CSV.
 
-        # Handles 'Source' and 'CallStack' columns (ensure they are strings)
-        df['Source'] = df['Source'].astype(str)
-        df['CallStack'] = df['CallStack'].astype(str)
+        Nothing is read until the query is collected. Projection pushdown means only the
+        requested columns are decoded from the file, and rows are validated only on the
+        timestamp/numerical columns that are part of the projection.
 
-        # Drops rows with any NaN values that resulted from conversion errors
-        df = df.dropna()
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]], default=None
+            The columns to load. If None, all columns are loaded.
 
-        # Resets index after dropping rows
-        df = df.reset_index(drop=True)
+        Returns
+        -------
+        pl.LazyFrame
+            The lazy query producing the cleaned data.
+        """
+        if pl is None:
+            raise ImportError("The Polars engine requires the 'polars' package (pip install polars).")
 
-        print("Data preprocessing completed.")
-        return df
+        selected = _include_columns(columns) or list(CSV_COLUMN_TYPES)
+        schema = {
+            'Timestamp': pl.String,
+            'Operation': pl.String,
+            'BlockSize': pl.Int64,
+            'Time': pl.Float64,
+            'Fragmentation': pl.Float64,
+            'Source': pl.String,
+            'CallStack': pl.String,
+            'MemoryAddress': pl.String,
+            'ThreadID': pl.String,
+            'AllocationID': pl.String,
+        }
+        conversions = []
+        if 'Timestamp' in selected:
+            conversions.append(pl.col('Timestamp').str.to_datetime(
+                POLARS_TIMESTAMP_FORMAT, time_unit='ns', strict=False))
+        for col in ('Operation', 'ThreadID', 'Source', 'CallStack', 'MemoryAddress'):
+            if col in selected:
+                conversions.append(pl.col(col).cast(pl.Categorical))
+
+        # ignore_errors turns unparsable numbers into nulls, which drop_nulls then removes
+        lf = pl.scan_csv(self.file_path, schema_overrides=schema, ignore_errors=True).select(selected)
+        if conversions:
+            lf = lf.with_columns(conversions)
+        required = [col for col in ['Timestamp'] + NUMERIC_COLUMNS if col in selected]
+        if required:
+            lf = lf.drop_nulls(required)
+        # Like preprocess_data, drop infinite values, which parse as valid floats
+        finite = [pl.col(col).is_finite() for col in NUMERIC_COLUMNS
+                  if col in selected and schema[col].is_float()]
+        if finite:
+            lf = lf.filter(finite)
+        return lf
+
+    def collect_frame(self, columns: Optional[Iterable[str]] = None) -> Optional['pl.DataFrame']:
+        """
+        Runs the lazy Polars query with the streaming engine.
+
+        The collected frame can be fed to VisualizerPolars via ``frame.lazy()``, which lets
+        each plot's aggregation run as one fused query without converting to pandas.
+
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]], default=None
+            The columns to load. If None, all columns are loaded.
+
+        Returns
+        -------
+        Optional[pl.DataFrame]
+            The cleaned Polars DataFrame, or None if an error occurred.
+        """
+        try:
+            frame = self.scan_data(columns).collect(engine='streaming')
+        except ImportError as e:
+            log.error("Error: %s", e)
+            return None
+        except FileNotFoundError:
+            log.error("Error: File not found at %s", self.file_path)
+            return None
+        except pl.exceptions.NoDataError:
+            log.error("Error: File at %s is empty", self.file_path)
+            return None
+        except Exception as e:
+            log.error("An unexpected error occurred: %s", e)
+            return None
+
+        log.info("Data loaded and preprocessed with Polars from %s", self.file_path)
+        return frame
+
+    def collect_data(self, columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Runs the lazy Polars query with the streaming engine and converts the result to pandas.
+
+        The returned DataFrame uses the same dtypes as preprocess_data, so it can be handed
+        to the Visualizer directly.
+
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]], default=None
+            The columns to load. If None, all columns are loaded.
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            The preprocessed DataFrame, or None if an error occurred.
+        """
+        frame = self.collect_frame(columns)
+        return None if frame is None else self.frame_to_pandas(frame)
+
+    @staticmethod
+    def frame_to_pandas(frame: 'pl.DataFrame') -> pd.DataFrame:
+        """
+        Converts a collected Polars frame to pandas with the preprocess_data dtypes.
+
+        Parameters
+        ----------
+        frame : pl.DataFrame
+            The frame returned by collect_frame.
+
+        Returns
+        -------
+        pd.DataFrame
+            The converted DataFrame.
+        """
+        df = frame.to_pandas()
+        dtype_map = {col: dtype for col, dtype in PREPROCESS_DTYPES.items() if col in df.columns}
+        return _narrow_numeric(df.astype(dtype_map, copy=False), df.columns)
 
     @staticmethod
     def _parse_timestamps(series: pd.Series) -> pd.Series:
         """
-        Parse timestamp strings using known formats, falling back silently when necessary.
+        Parse timestamps, detecting the representation once from the first non-null value.
+
+        All-digit values are treated as epoch microseconds and converted arithmetically.
+        Otherwise the single matching format is chosen from the sample, and only rows it
+        fails on go through the slower mixed-format fallback.
         """
-        parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
-        valid_mask = series.notna()
-        formats = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f")
+        valid = series.dropna()
+        if valid.empty:
+            return pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+        sample = str(valid.iloc[0]).strip()
+
+        if sample.isdigit():
+            if pd.api.types.is_integer_dtype(series.dtype):
+                # Reinterprets the integer buffer as datetimes without parsing
+                micros = np.asarray(series, dtype=np.int64).view("datetime64[us]")
+                return pd.Series(micros.astype("datetime64[ns]"), index=series.index)
+            return pd.to_datetime(pd.to_numeric(series, errors="coerce"), unit="us", errors="coerce")
 
-        for fmt in formats:
-            remaining = valid_mask & parsed.isna()
-            if not remaining.any():
-                break
-            converted = pd.to_datetime(series[remaining], format=fmt, errors="coerce")
-            parsed.loc[remaining] = converted
+        fmt = "%Y-%m-%d %H:%M:%S.%f" if "." in sample else "%Y-%m-%d %H:%M:%S"
+        parsed = pd.to_datetime(series, format=fmt, errors="coerce")
 
-        remaining = valid_mask & parsed.isna()
-        if remaining.any():
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", category=UserWarning)
-                fallback = pd.to_datetime(series[remaining], errors="coerce")
-            parsed.loc[remaining] = fallback
+        # NaT is the minimum int64, so the failed rows come from one comparison on the int64
+        # view of the parsed buffer, ANDed in place with the non-null mask. The comparison
+        # result is the output because it is a fresh array; pandas may hand out read-only
+        # views under copy-on-write.
+        remaining = parsed.to_numpy().view("i8") == np.iinfo(np.int64).min
+        np.logical_and(remaining, series.notna().to_numpy(), out=remaining)
+        idx = np.flatnonzero(remaining)
+        if idx.size == 0:
+            return parsed
 
-        return parsed
+        # Scatters the fallback results by position into a copy of the parsed buffer, so no
+        # label-based .loc assignment or index alignment is involved
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
+            fallback = pd.to_datetime(series.to_numpy()[idx], errors="coerce")
+        out = parsed.to_numpy(dtype="datetime64[ns]", copy=True)
+        out[idx] = np.asarray(fallback, dtype="datetime64[ns]")
+        return pd.Series(out, index=series.index, name=series.name)
@@ -1,14 +1,185 @@
+import os
+import sys
+import matplotlib
+import matplotlib.image
+
+# Selects the non-interactive Agg backend before pyplot is imported when there is no display
+# (or VIS_HEADLESS is set), so saving PNGs never pays for importing a GUI toolkit. An
+# explicit MPLBACKEND still takes precedence.
+if 'MPLBACKEND' not in os.environ and (
+        os.environ.get('VIS_HEADLESS')
+        or (sys.platform.startswith('linux')
+            and not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'))):
+    matplotlib.use('Agg')
+
 import pandas as pd
 import matplotlib.pyplot as plt
-from typing import Optional
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import pyarrow as pa
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Tuple
 import numpy as np
-import os
 import warnings
 
+try:
+    import polars as pl
+except ImportError:  # Polars is optional and only needed by VisualizerPolars
+    pl = None
+
 # Suppress non-critical warnings (Optional)
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=pd.errors.SettingWithCopyWarning)
 
+# Plot methods that plots_from_batches can compute from streamed record batches
+STREAMABLE_PLOTS = (
+    'total_memory_usage_over_time',
+    'allocation_size_distribution',
+    'memory_usage_by_source',
+    'number_of_allocations_by_source',
+)
+
+# Plot methods that VisualizerPolars computes with Polars queries
+POLARS_PLOTS = (
+    'total_memory_usage_over_time',
+    'allocation_deallocation_rates_over_time',
+    'memory_usage_by_source',
+    'number_of_allocations_by_source',
+)
+
+# Power-of-two bin edges for allocation sizes; buddy blocks are powers of two, so each
+# block size gets its own bar, and fixed edges work without knowing the size range in
+# advance when streaming.
+SIZE_BIN_EDGES = 2.0 ** np.arange(65)
+
+# The over-time line plots draw series longer than this as a min/max envelope over
+# TIME_SERIES_BUCKETS time buckets instead of one vertex (and marker) per row.
+TIME_SERIES_MAX_POINTS = 5000
+TIME_SERIES_BUCKETS = 2000
+
+# Line plots with more points than this are drawn without per-point markers, which are
+# indistinguishable at that density and dominate the rendering time.
+MARKER_MAX_POINTS = 1000
+
+# Number of most frequent call stacks drawn by call_stack_trace_frequency; bar charts with
+# thousands of stack traces are unreadable.
+CALL_STACK_TOP_N = 20
+
+# Number of sources drawn by the per-source bar charts (the largest by the plotted value);
+# traces that tag allocations by function can have thousands of sources.
+SOURCE_TOP_N = 30
+
+# zlib level for saved PNGs. Pillow defaults to 6; level 1 encodes a report's plots about
+# 30% faster for files about a quarter larger, which suits throwaway profiling output.
+PNG_COMPRESS_LEVEL = 1
+
+# Percentiles drawn by allocation_latency_percentiles
+LATENCY_PERCENTILES = (0.50, 0.95, 0.99)
+
+
+def _configure_style() -> None:
+    """
+    Applies the matplotlib styling shared by all plots.
+
+    Called once at import rather than per Visualizer instance, since rcParams are global.
+    """
+    # Use matplotlib style similar to seaborn whitegrid
+    plt.style.use('default')
+    plt.rcParams['axes.grid'] = True
+    plt.rcParams['grid.linestyle'] = '-'
+    plt.rcParams['grid.alpha'] = 0.3
+    plt.rcParams['axes.facecolor'] = '#EAEAF2'
+    plt.rcParams['figure.facecolor'] = 'white'
+
+    # Merge line segments that deviate by less than a pixel; long time series draw much
+    # faster and look the same
+    plt.rcParams['path.simplify_threshold'] = 1.0
+
+
+_configure_style()
+
+
+class PreparedData:
+    """
+    Row selections of a performance DataFrame that are shared by the plot methods.
+
+    Each selection is computed on first use and then reused, so a report that draws many
+    plots from one DataFrame filters out summary rows and sorts by timestamp only once.
+    The DataFrame must not be modified while it is being plotted.
+
+    Attributes
+    ----------
+    df : pd.DataFrame
+        The preprocessed DataFrame containing performance data.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+
+    @cached_property
+    def non_summary(self) -> np.ndarray:
+        """Boolean mask of the allocation and deallocation rows."""
+        return (self.df['Operation'] != 'Summary').to_numpy()
+
+    @cached_property
+    def is_alloc(self) -> np.ndarray:
+        """Boolean mask of the allocation rows."""
+        return (self.df['Operation'] == 'Allocation').to_numpy()
+
+    @cached_property
+    def timestamps(self) -> np.ndarray:
+        """The Timestamp column as a datetime64[ns] array."""
+        return self.df['Timestamp'].to_numpy(dtype='datetime64[ns]')
+
+    @cached_property
+    def time_order(self) -> np.ndarray:
+        """Positions of the non-summary rows in timestamp order; ties keep file order."""
+        rows = np.flatnonzero(self.non_summary)
+        timestamps = self.timestamps[rows]
+        # Loggers usually append in time order; NaT compares False and takes the sort
+        if (timestamps[1:] >= timestamps[:-1]).all():
+            return rows
+        return rows[np.argsort(timestamps, kind='stable')]
+
+    @cached_property
+    def alloc_sources(self) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Integer source codes of the allocation rows (-1 for missing) and the source labels.
+
+        Categorical Source columns already carry codes; anything else is factorized once.
+        """
+        source = self.df['Source'][self.is_alloc]
+        if isinstance(source.dtype, pd.CategoricalDtype):
+            return source.cat.codes.to_numpy(), source.cat.categories
+        codes, labels = pd.factorize(source, sort=True)
+        return codes, labels
+
+    @cached_property
+    def alloc_source_counts(self) -> np.ndarray:
+        """Number of allocations per entry of the alloc_sources labels."""
+        codes, labels = self.alloc_sources
+        return np.bincount(codes[codes >= 0], minlength=len(labels))
+
+    def alloc_source_sums(self, column: str) -> np.ndarray:
+        """
+        Sums a numeric column over the allocation rows of each source in one C loop.
+
+        Parameters
+        ----------
+        column : str
+            The column to sum.
+
+        Returns
+        -------
+        np.ndarray
+            One float64 sum per entry of the alloc_sources labels.
+        """
+        codes, labels = self.alloc_sources
+        values = self.df[column].to_numpy(dtype=np.float64)[self.is_alloc]
+        valid = codes >= 0
+        return np.bincount(codes[valid], weights=values[valid], minlength=len(labels))
+
 
 class Visualizer:
     """
@@ -39,19 +210,108 @@ class Visualizer:
         Plots the frequency of allocations from each call stack.
     throughput_trends(df: pd.DataFrame, output_path: Optional[str] = None) -> None
         Plots allocation and deallocation throughput trends over multiple benchmarks.
+    plots_from_batches(batches: Iterable[pa.RecordBatch], output_paths: Dict[str, str]) -> None
+        Generates reduction-style plots from streamed record batches.
+    flush() -> None
+        Waits until every saved plot has been written to disk.
     """
 
     def __init__(self):
         """
-        Initializes the Visualizer class with matplotlib styling.
+        Initializes the Visualizer class.
+        """
+        # Figure shared by the plot methods; see _figure
+        self._fig = None
+        # Row selections of the most recently plotted DataFrame; see _prepare
+        self._prepared = None
+        # Background PNG writer and its queued (output path, description, write) entries; see _savefig
+        self._writer = None
+        self._pending_writes: List[Tuple[str, str, Future]] = []
+
+    def _figure(self, figsize: Tuple[float, float]) -> plt.Figure:
         """
-        # Use matplotlib style similar to seaborn whitegrid
-        plt.style.use('default')
-        plt.rcParams['axes.grid'] = True
-        plt.rcParams['grid.linestyle'] = '-'
-        plt.rcParams['grid.alpha'] = 0.3
-        plt.rcParams['axes.facecolor'] = '#EAEAF2'
-        plt.rcParams['figure.facecolor'] = 'white'
+        Returns the shared figure, cleared and resized, as the current pyplot figure.
+
+        Creating a figure applies rcParams and sets up the canvas, which adds up over a
+        report with many plots. Saved plots therefore leave the figure open and the next
+        plot clears and reuses it. A figure closed after being shown is recreated.
+
+        Parameters
+        ----------
+        figsize : Tuple[float, float]
+            The figure size in inches.
+
+        Returns
+        -------
+        plt.Figure
+            The figure to draw on.
+        """
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig = plt.figure(figsize=figsize)
+        else:
+            self._fig.clf()
+            self._fig.set_size_inches(figsize)
+            plt.figure(self._fig.number)
+        return self._fig
+
+    def _savefig(self, output_path: str, description: str) -> None:
+        """
+        Saves the current figure, encoding PNGs on a background writer thread.
+
+        The figure is rendered here and its pixels copied, so the shared figure can be cleared
+        for the next plot right away while the PNG compression, which releases the GIL, runs
+        on the writer thread. Other formats, and figures whose canvas is not Agg-based, are
+        saved synchronously. The "saved to" message is printed once the file is written;
+        call flush to wait for the remaining writes.
+
+        Parameters
+        ----------
+        output_path : str
+            The file path to save the plot image.
+        description : str
+            What was plotted, used in the "saved to" message.
+        """
+        fig = plt.gcf()
+        if not output_path.lower().endswith('.png') or not isinstance(fig.canvas, FigureCanvasAgg):
+            fig.savefig(output_path)
+            print(f"{description} saved to {os.path.abspath(output_path)}")
+            return
+
+        fig.canvas.draw()
+        pixels = np.asarray(fig.canvas.buffer_rgba()).copy()
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='png-writer')
+        write = self._writer.submit(matplotlib.image.imsave, output_path, pixels, dpi=fig.dpi,
+                                    pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        self._pending_writes.append((output_path, description, write))
+        self._report_writes(wait=False)
+
+    def _report_writes(self, wait: bool) -> None:
+        """
+        Reports queued PNG writes in submission order, printing the outcome of each.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to wait for unfinished writes; otherwise reporting stops at the first one.
+        """
+        while self._pending_writes:
+            output_path, description, write = self._pending_writes[0]
+            if not wait and not write.done():
+                return
+            self._pending_writes.pop(0)
+            try:
+                write.result()
+            except Exception as e:
+                print(f"Failed to write plot to {os.path.abspath(output_path)}: {e}")
+            else:
+                print(f"{description} saved to {os.path.abspath(output_path)}")
+
+    def flush(self) -> None:
+        """
+        Waits until every saved plot has been written to disk, reporting failed writes.
+        """
+        self._report_writes(wait=True)
 
     def set_x_limits(self, plt_obj, timestamps: pd.Series, buffer_ratio: float = 0.05):
         """
@@ -82,6 +342,41 @@ class Visualizer:
             # If all timestamps are the same, set arbitrary limits
             plt_obj.xlim(min_timestamp - pd.Timedelta(seconds=1), max_timestamp + pd.Timedelta(seconds=1))
 
+    def _prepare(self, df: pd.DataFrame) -> PreparedData:
+        """
+        Returns the PreparedData of the DataFrame, reusing it across calls with the same DataFrame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The preprocessed DataFrame containing performance data.
+
+        Returns
+        -------
+        PreparedData
+            The shared row selections of the DataFrame.
+        """
+        if self._prepared is None or self._prepared.df is not df:
+            self._prepared = PreparedData(df)
+        return self._prepared
+
+    def _masks(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the non-summary and allocation row masks of the DataFrame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The preprocessed DataFrame containing performance data.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Boolean arrays selecting the non-summary rows and the allocation rows.
+        """
+        prepared = self._prepare(df)
+        return prepared.non_summary, prepared.is_alloc
+
     def total_memory_usage_over_time(self, df: pd.DataFrame, output_path: Optional[str] = None) -> None:
         """
         Plots total memory usage over time.
@@ -98,27 +393,36 @@ class Visualizer:
         None
         """
         try:
-            # Exclude summary logs
-            df_sorted = df[df['Operation'] != 'Summary'].sort_values('Timestamp').copy()
-            df_sorted['NetMemoryChange'] = df_sorted.apply(
-                lambda row: row['BlockSize'] if row['Operation'] == 'Allocation' else -row['BlockSize'], axis=1)
-            df_sorted['TotalMemory'] = df_sorted['NetMemoryChange'].cumsum()
-
-            plt.figure(figsize=(12, 6))
-            plt.plot(df_sorted['Timestamp'], df_sorted['TotalMemory'], linewidth=2)
+            # Exclude summary logs and take the remaining rows in time order
+            prepared = self._prepare(df)
+            rows = prepared.time_order
+            timestamps = pd.DatetimeIndex(prepared.timestamps[rows])
+
+            # Gathers the block sizes in time order into a single int64 buffer, then negates
+            # the deallocations and accumulates in place, so no further N-sized temporaries
+            total_memory = df['BlockSize'].to_numpy().take(rows).astype(np.int64, copy=False)
+            np.negative(total_memory, out=total_memory, where=~prepared.is_alloc[rows])
+            np.cumsum(total_memory, out=total_memory)
+
+            self._figure(figsize=(12, 6))
+            if len(total_memory) > TIME_SERIES_MAX_POINTS:
+                # Converting and drawing every row's vertex dominates on large logs; the
+                # min/max envelope looks the same at the plotted resolution
+                plt.plot(*self._min_max_decimate(prepared.timestamps[rows], total_memory, TIME_SERIES_BUCKETS),
+                         linewidth=2)
+            else:
+                plt.plot(timestamps, total_memory, linewidth=2)
             plt.title('Total Memory Usage Over Time', fontsize=14, fontweight='bold')
             plt.xlabel('Timestamp', fontsize=12)
             plt.ylabel('Total Allocated Memory (bytes)', fontsize=12)
 
             # Set x-axis limits based on data
-            self.set_x_limits(plt, df_sorted['Timestamp'])
+            self.set_x_limits(plt, timestamps)
 
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Total memory usage plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Total memory usage plot')
             else:
                 plt.show(block=True)  # Wait until the plot window is closed
                 plt.close()
@@ -145,21 +449,45 @@ class Visualizer:
         """
         try:
             # Exclude summary logs
-            df_temp = df[df['Operation'] != 'Summary'].copy()
-            df_temp.set_index('Timestamp', inplace=True)
-            counts = df_temp.groupby([pd.Grouper(freq=interval.lower()), 'Operation'], observed=False).size().unstack(fill_value=0)
-
-            if counts.empty:
+            prepared = self._prepare(df)
+            non_summary = prepared.non_summary
+            operation = df['Operation'][non_summary]
+            if isinstance(operation.dtype, pd.CategoricalDtype):
+                codes = operation.cat.codes.to_numpy()
+                labels = operation.cat.categories
+            else:
+                codes, labels = pd.factorize(operation, sort=True)
+            timestamps = prepared.timestamps[non_summary]
+            valid = (codes >= 0) & ~np.isnat(timestamps)
+            ticks = timestamps[valid].view(np.int64)
+            if ticks.size == 0:
                 print("No data available for Allocation/Deallocation Rates Over Time plot.")
                 return
 
-            unique_timestamps = counts.index.nunique()
-            if unique_timestamps < 2:
+            # Counts operations per (interval, operation) cell with one bincount over
+            # bin * n_operations + code; bins start at midnight of the first day like pd.Grouper
+            step, day = pd.Timedelta(interval.lower()).value, pd.Timedelta(days=1).value
+            origin = ticks.min() // day * day
+            bins = (ticks - origin) // step
+            first_bin = bins.min()
+            bins -= first_bin
+            n_bins = int(bins.max()) + 1
+            if n_bins < 2:
                 print("Insufficient variation in timestamps for Allocation/Deallocation Rates Over Time plot.")
                 return
 
-            plt.figure(figsize=(12, 6))
-            counts.plot(kind='line', marker='o')
+            cells = np.bincount(bins * len(labels) + codes[valid], minlength=n_bins * len(labels))
+            cells = cells.reshape(n_bins, len(labels))
+            index = pd.DatetimeIndex(origin + (first_bin + np.arange(n_bins)) * step, name='Timestamp')
+
+            # Categorical Operation columns include operations that were filtered out; skip them
+            present = cells.any(axis=0)
+            counts = pd.DataFrame(cells[:, present], index=index, columns=labels[present])
+
+            marker = 'o' if len(counts) <= MARKER_MAX_POINTS else None
+            self._figure(figsize=(12, 6))
+            for operation in counts.columns:
+                plt.plot(counts.index, counts[operation].to_numpy(), marker=marker, label=operation)
             plt.title('Allocation and Deallocation Rates Over Time')
             plt.xlabel('Timestamp')
             plt.ylabel('Number of Operations')
@@ -171,9 +499,7 @@ class Visualizer:
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Allocation/deallocation rates plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Allocation/deallocation rates plot')
             else:
                 plt.show(block=True)
                 plt.close()
@@ -196,16 +522,30 @@ class Visualizer:
         None
         """
         try:
-            # Exclude summary logs
-            df = df[df['Operation'] != 'Summary']
-            if df.empty:
+            # Exclude summary logs; rows are selected on the shared arrays, so no sub-frame
+            # of the non-summary rows is gathered
+            prepared = self._prepare(df)
+            non_summary = prepared.non_summary
+            if not non_summary.any():
                 print("No data available for Allocation Latency Over Time plot.")
                 return
-
-            plt.figure(figsize=(12, 6))
-            for operation in df['Operation'].unique():
-                op_data = df[df['Operation'] == operation]
-                plt.plot(op_data['Timestamp'], op_data['Time'], 
+            operations = df['Operation']
+            latencies = df['Time'].to_numpy(dtype=np.float64)
+            timestamps = prepared.timestamps
+
+            self._figure(figsize=(12, 6))
+            for operation in operations[non_summary].unique():
+                is_operation = (operations == operation).to_numpy()
+                if np.count_nonzero(is_operation) > TIME_SERIES_MAX_POINTS:
+                    # Per-marker paths make huge traces slow to draw; plot the min/max envelope
+                    # of the operation's rows, taken in the shared time order
+                    rows = prepared.time_order
+                    rows = rows[is_operation[rows]]
+                    plt.plot(*self._min_max_decimate(timestamps[rows], latencies[rows], TIME_SERIES_BUCKETS),
+                             label=operation, alpha=0.7, linewidth=1.5)
+                    continue
+                rows = np.flatnonzero(is_operation)
+                plt.plot(timestamps[rows], latencies[rows],
                         marker='o', label=operation, alpha=0.7, linewidth=1.5)
             plt.title('Allocation/Deallocation Latency Over Time', fontsize=14, fontweight='bold')
             plt.xlabel('Timestamp', fontsize=12)
@@ -213,20 +553,95 @@ class Visualizer:
             plt.legend(title='Operation', loc='best')
 
             # Set x-axis limits based on data
-            self.set_x_limits(plt, df['Timestamp'])
+            self.set_x_limits(plt, pd.DatetimeIndex(timestamps[non_summary]))
 
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Allocation latency plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Allocation latency plot')
             else:
                 plt.show(block=True)
                 plt.close()
         except Exception as e:
             print(f"An error occurred while generating the allocation latency plot: {e}")
 
+    @staticmethod
+    def _min_max_decimate(times: np.ndarray, y: np.ndarray,
+                          n_buckets: int) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+        """
+        Reduces a time series to the minimum and maximum of each of n_buckets equal time buckets.
+
+        Drawing both extremes of every bucket keeps the visual envelope of the series,
+        including spikes, while bounding the number of plotted points.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            The sorted datetime64[ns] timestamps of the series.
+        y : np.ndarray
+            The values of the series, in the same order.
+        n_buckets : int
+            The number of time buckets.
+
+        Returns
+        -------
+        Tuple[pd.DatetimeIndex, np.ndarray]
+            The bucket start times, each repeated twice, and the interleaved minima and maxima.
+        """
+        ticks = times.view(np.int64) - times[0].view(np.int64)
+        # Dividing by the bucket width rather than scaling by n_buckets first keeps the
+        # arithmetic within int64 for any span (ticks * 2000 overflows after about 53 days)
+        buckets = ticks // (int(ticks[-1]) // n_buckets + 1)
+        starts = np.flatnonzero(np.diff(buckets, prepend=-1))
+
+        envelope = np.column_stack((np.minimum.reduceat(y, starts), np.maximum.reduceat(y, starts)))
+        return pd.DatetimeIndex(np.repeat(times[starts], 2)), envelope.ravel()
+
+    @staticmethod
+    def _uniform_bins(values: np.ndarray, n_bins: int) -> np.ndarray:
+        """
+        Returns the index of the equal-width bin spanning [min, max] that each value falls in.
+
+        Matches np.histogram's bins, including its corrections for floating-point rounding
+        at the edges, without the per-value binary search np.histogram2d performs.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The finite float64 values to bin.
+        n_bins : int
+            The number of bins.
+
+        Returns
+        -------
+        np.ndarray
+            Bin indices in [0, n_bins).
+        """
+        low, high = values.min(), values.max()
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        edges = np.linspace(low, high, n_bins + 1)
+        if not (np.diff(edges) > 0).all():
+            # Bins narrower than the float spacing (e.g. a sub-microsecond span of epoch
+            # nanoseconds) repeat edges; bin exactly as np.histogram2d does then
+            bins = np.searchsorted(edges, values, side='right')
+            bins[values == edges[-1]] -= 1
+            return bins - 1
+        bins = ((values - low) * (n_bins / (high - low))).astype(np.intp)
+        bins[bins == n_bins] -= 1
+        bins[values < edges[bins]] -= 1
+        bins[(values >= edges[bins + 1]) & (bins != n_bins - 1)] += 1
+        return bins
+
+    @staticmethod
+    def _top_n_title(title: str, top_n: Optional[int], n_items: int) -> str:
+        """
+        Appends "(top N)" to a bar chart title when only the top_n of n_items bars are drawn.
+        """
+        if top_n is not None and n_items > top_n:
+            return f'{title} (top {top_n})'
+        return title
+
     def allocation_latency_percentiles(self, df: pd.DataFrame, output_path: Optional[str] = None, 
                                       window_size: str = '10s') -> None:
         """
@@ -239,7 +654,7 @@ class Visualizer:
         output_path : Optional[str], default=None
             The file path to save the plot image. If None, the plot is displayed.
         window_size : str, default='10s'
-            Rolling window size for percentile calculations (e.g., '10s', '1min').
+            Window size for percentile calculations (e.g., '10s', '1min').
 
         Returns
         -------
@@ -247,34 +662,35 @@ class Visualizer:
         """
         try:
             # Exclude summary logs
-            df = df[df['Operation'] != 'Summary'].copy()
+            non_summary, _ = self._masks(df)
+            df = df.loc[non_summary, ['Timestamp', 'Operation', 'Time']]
             if df.empty:
                 print("No data available for Allocation Latency Percentiles plot.")
                 return
 
+            # Index by timestamp so each operation's latencies can be resampled into windows
+            df = df.set_index('Timestamp')
+            operations = df['Operation']
+
             # Create separate plots for Allocation and Deallocation
-            fig, axes = plt.subplots(2, 1, figsize=(14, 10))
+            axes = self._figure(figsize=(14, 10)).subplots(2, 1)
 
             for idx, operation in enumerate(['Allocation', 'Deallocation']):
-                op_data = df[df['Operation'] == operation].copy()
-                if op_data.empty:
+                latency = df['Time'][(operations == operation).to_numpy()]
+                if latency.empty:
                     print(f"No {operation} data available for percentile calculation.")
                     continue
 
-                # Sort by timestamp and set as index
-                op_data = op_data.sort_values('Timestamp').set_index('Timestamp')
-
-                # Calculate rolling percentiles
-                p50 = op_data['Time'].rolling(window=window_size).quantile(0.50)
-                p95 = op_data['Time'].rolling(window=window_size).quantile(0.95)
-                p99 = op_data['Time'].rolling(window=window_size).quantile(0.99)
+                # Calculate percentiles per window
+                percentiles = self._windowed_percentiles(latency, window_size)
+                p50, p95, p99 = (percentiles[q] for q in LATENCY_PERCENTILES)
 
                 # Plot percentiles
-                axes[idx].plot(p50.index, p50.values, label='p50 (Median)', linewidth=2, alpha=0.8)
-                axes[idx].plot(p95.index, p95.values, label='p95', linewidth=2, alpha=0.8)
-                axes[idx].plot(p99.index, p99.values, label='p99', linewidth=2, alpha=0.8)
+                axes[idx].plot(percentiles.index, p50, label='p50 (Median)', linewidth=2, alpha=0.8)
+                axes[idx].plot(percentiles.index, p95, label='p95', linewidth=2, alpha=0.8)
+                axes[idx].plot(percentiles.index, p99, label='p99', linewidth=2, alpha=0.8)
                 
-                axes[idx].fill_between(p50.index, p50.values, p99.values, alpha=0.2)
+                axes[idx].fill_between(percentiles.index, p50, p99, alpha=0.2)
                 axes[idx].set_title(f'{operation} Latency Percentiles (window={window_size})', 
                                    fontsize=13, fontweight='bold')
                 axes[idx].set_xlabel('Timestamp', fontsize=11)
@@ -285,15 +701,37 @@ class Visualizer:
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Latency percentiles plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Latency percentiles plot')
             else:
                 plt.show(block=True)
                 plt.close()
         except Exception as e:
             print(f"An error occurred while generating the latency percentiles plot: {e}")
 
+    @staticmethod
+    def _windowed_percentiles(latency: pd.Series, window_size: str) -> pd.DataFrame:
+        """
+        Computes the LATENCY_PERCENTILES of a latency series over consecutive time windows.
+
+        Resampling yields one row per window instead of one per operation, which is all the
+        plot can resolve and avoids recomputing quantiles for every sample. Windows without
+        operations are dropped.
+
+        Parameters
+        ----------
+        latency : pd.Series
+            Latencies indexed by a DatetimeIndex.
+        window_size : str
+            Window size (e.g., '10s', '1min').
+
+        Returns
+        -------
+        pd.DataFrame
+            One column per percentile, indexed by window start.
+        """
+        percentiles = latency.resample(window_size).quantile(list(LATENCY_PERCENTILES)).unstack()
+        return percentiles.dropna(how='all')
+
     def allocation_size_distribution(self, df: pd.DataFrame, output_path: Optional[str] = None) -> None:
         """
         Plots the distribution of allocation sizes.
@@ -310,29 +748,26 @@ class Visualizer:
         None
         """
         try:
-            alloc_df = df[(df['Operation'] == 'Allocation') & (df['Operation'] != 'Summary')]
-            if alloc_df.empty:
+            _, is_alloc = self._masks(df)
+            sizes = df['BlockSize'].to_numpy()[is_alloc]
+            if sizes.size == 0:
                 print("No allocation data available for Allocation Size Distribution plot.")
                 return
 
-            plt.figure(figsize=(10, 6))
-            plt.hist(alloc_df['BlockSize'], bins=30, edgecolor='black', alpha=0.7)
-            plt.title('Allocation Size Distribution', fontsize=14, fontweight='bold')
-            plt.xlabel('Block Size (bytes)', fontsize=12)
-            plt.ylabel('Number of Allocations', fontsize=12)
-            plt.tight_layout()
+            # Counts per power-of-two bin, the same bins the streamed plot accumulates
+            self._draw_size_distribution(np.bincount(np.digitize(sizes, SIZE_BIN_EDGES),
+                                                     minlength=len(SIZE_BIN_EDGES) + 1))
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Allocation size distribution plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Allocation size distribution plot')
             else:
                 plt.show(block=True)
                 plt.close()
         except Exception as e:
             print(f"An error occurred while generating the allocation size distribution plot: {e}")
 
-    def memory_usage_by_source(self, df: pd.DataFrame, output_path: Optional[str] = None) -> None:
+    def memory_usage_by_source(self, df: pd.DataFrame, output_path: Optional[str] = None,
+                               top_n: Optional[int] = SOURCE_TOP_N) -> None:
         """
         Plots total memory usage by source (module/function/class).
 
@@ -342,42 +777,54 @@ class Visualizer:
             The preprocessed DataFrame containing performance data.
         output_path : Optional[str], default=None
             The file path to save the plot image. If None, the plot is displayed.
+        top_n : Optional[int], default=SOURCE_TOP_N
+            Plot only the top_n sources that allocated the most memory. If None, all sources are plotted.
 
         Returns
         -------
         None
         """
         try:
-            alloc_df = df[(df['Operation'] == 'Allocation') & (df['Operation'] != 'Summary')]
-            if alloc_df.empty:
+            _, is_alloc = self._masks(df)
+            if not is_alloc.any():
                 print("No allocation data available for Memory Usage By Source plot.")
                 return
 
-            memory_by_source = alloc_df.groupby('Source')['BlockSize'].sum().reset_index()
+            # Sums block sizes over the shared source codes in a single C loop
+            prepared = self._prepare(df)
+            _, labels = prepared.alloc_sources
+            memory = prepared.alloc_source_sums('BlockSize')
+            observed = np.flatnonzero(prepared.alloc_source_counts)
+            n_sources = observed.size
+            if top_n is not None and top_n < n_sources:
+                # Keeps the sources that allocated the most; they are still listed by name
+                observed = np.sort(observed[np.argsort(-memory[observed], kind='stable')[:top_n]])
+            memory_by_source = pd.DataFrame({'Source': labels[observed], 'BlockSize': memory[observed]})
+            memory_by_source = memory_by_source.sort_values('Source', ignore_index=True)
             if memory_by_source.empty:
                 print("No memory usage data available for Memory Usage By Source plot.")
                 return
 
-            plt.figure(figsize=(12, 6))
+            self._figure(figsize=(12, 6))
             plt.bar(memory_by_source['Source'], memory_by_source['BlockSize'], 
                    edgecolor='black', alpha=0.7)
-            plt.title('Total Memory Usage by Source', fontsize=14, fontweight='bold')
+            plt.title(self._top_n_title('Total Memory Usage by Source', top_n, n_sources),
+                      fontsize=14, fontweight='bold')
             plt.xlabel('Source', fontsize=12)
             plt.ylabel('Total Allocated Memory (bytes)', fontsize=12)
             plt.xticks(rotation=45, ha='right')
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Memory usage by source plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Memory usage by source plot')
             else:
                 plt.show(block=True)
                 plt.close()
         except Exception as e:
             print(f"An error occurred while generating the memory usage by source plot: {e}")
 
-    def number_of_allocations_by_source(self, df: pd.DataFrame, output_path: Optional[str] = None) -> None:
+    def number_of_allocations_by_source(self, df: pd.DataFrame, output_path: Optional[str] = None,
+                                        top_n: Optional[int] = SOURCE_TOP_N) -> None:
         """
         Plots the number of allocations per source.
 
@@ -387,36 +834,43 @@ class Visualizer:
             The preprocessed DataFrame containing performance data.
         output_path : Optional[str], default=None
             The file path to save the plot image. If None, the plot is displayed.
+        top_n : Optional[int], default=SOURCE_TOP_N
+            Plot only the top_n sources with the most allocations. If None, all sources are plotted.
 
         Returns
         -------
         None
         """
         try:
-            alloc_df = df[(df['Operation'] == 'Allocation') & (df['Operation'] != 'Summary')]
-            if alloc_df.empty:
+            _, is_alloc = self._masks(df)
+            if not is_alloc.any():
                 print("No allocation data available for Number of Allocations By Source plot.")
                 return
 
-            counts_by_source = alloc_df['Source'].value_counts().reset_index()
-            counts_by_source.columns = ['Source', 'AllocationCount']
+            # Orders the sources that allocated by descending count, as value_counts does
+            prepared = self._prepare(df)
+            _, labels = prepared.alloc_sources
+            counts = prepared.alloc_source_counts
+            observed = np.flatnonzero(counts)
+            n_sources = observed.size
+            observed = observed[np.argsort(-counts[observed], kind='stable')][:top_n]
+            counts_by_source = pd.DataFrame({'Source': labels[observed], 'AllocationCount': counts[observed]})
             if counts_by_source.empty:
                 print("No allocation count data available for Number of Allocations By Source plot.")
                 return
 
-            plt.figure(figsize=(12, 6))
+            self._figure(figsize=(12, 6))
             plt.bar(counts_by_source['Source'], counts_by_source['AllocationCount'],
                    edgecolor='black', alpha=0.7)
-            plt.title('Number of Allocations by Source', fontsize=14, fontweight='bold')
+            plt.title(self._top_n_title('Number of Allocations by Source', top_n, n_sources),
+                      fontsize=14, fontweight='bold')
             plt.xlabel('Source', fontsize=12)
             plt.ylabel('Number of Allocations', fontsize=12)
             plt.xticks(rotation=45, ha='right')
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Number of allocations by source plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Number of allocations by source plot')
             else:
                 plt.show(block=True)
                 plt.close()
@@ -439,17 +893,26 @@ class Visualizer:
         None
         """
         try:
-            alloc_df = df[(df['Operation'] == 'Allocation') & (df['Operation'] != 'Summary')]
-            if alloc_df.empty:
+            _, is_alloc = self._masks(df)
+            if not is_alloc.any():
                 print("No allocation data available for Average Allocation Latency By Source plot.")
                 return
 
-            latency_by_source = alloc_df.groupby('Source')['Time'].mean().reset_index()
+            # Divides the per-source latency sums by the shared per-source allocation counts;
+            # the labels are already in category (or sorted) order, as groupby would list them
+            prepared = self._prepare(df)
+            _, labels = prepared.alloc_sources
+            counts = prepared.alloc_source_counts
+            observed = counts > 0
+            latency_by_source = pd.DataFrame({
+                'Source': labels[observed],
+                'Time': prepared.alloc_source_sums('Time')[observed] / counts[observed],
+            })
             if latency_by_source.empty:
                 print("No latency data available for Average Allocation Latency By Source plot.")
                 return
 
-            plt.figure(figsize=(12, 6))
+            self._figure(figsize=(12, 6))
             plt.bar(latency_by_source['Source'], latency_by_source['Time'],
                    edgecolor='black', alpha=0.7)
             plt.title('Average Allocation Latency by Source', fontsize=14, fontweight='bold')
@@ -459,9 +922,7 @@ class Visualizer:
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Average allocation latency by source plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Average allocation latency by source plot')
             else:
                 plt.show(block=True)
                 plt.close()
@@ -484,25 +945,23 @@ class Visualizer:
         None
         """
         try:
-            alloc_df = df[(df['Operation'] == 'Allocation') & (df['Operation'] != 'Summary')].copy()
-            if alloc_df.empty:
+            _, is_alloc = self._masks(df)
+            if not is_alloc.any():
                 print("No allocation data available for Allocation Size Vs Time Heatmap plot.")
                 return
 
-            # Create TimeBin and SizeBin using .loc to avoid SettingWithCopyWarning
-            alloc_df.loc[:, 'TimeBin'] = pd.cut(alloc_df['Timestamp'], bins=50)
-            alloc_df.loc[:, 'SizeBin'] = pd.cut(alloc_df['BlockSize'], bins=50)
-
-            heatmap_data = alloc_df.pivot_table(
-                index='SizeBin',
-                columns='TimeBin',
-                values='AllocationID',
-                aggfunc='count',
-                fill_value=0,
-                observed=True  # Explicitly set to avoid FutureWarning
-            )
+            # Counts allocations on a 50x50 size/time grid: the equal-width bins of each axis are
+            # computed arithmetically and the cells counted with one bincount over size * 50 + time
+            n_bins = 50
+            sizes = df['BlockSize'].to_numpy(dtype=np.float64)[is_alloc]
+            timestamps = self._prepare(df).timestamps[is_alloc].view(np.int64).astype(np.float64)
+            cells = self._uniform_bins(sizes, n_bins) * n_bins + self._uniform_bins(timestamps, n_bins)
+            counts = np.bincount(cells, minlength=n_bins * n_bins).reshape(n_bins, n_bins)
+
+            # Keeps only the size and time bins that received allocations
+            heatmap_data = counts[counts.any(axis=1)][:, counts.any(axis=0)]
 
-            if heatmap_data.empty:
+            if heatmap_data.size == 0:
                 print("No data available for Allocation Size Vs Time Heatmap plot.")
                 return
 
@@ -511,7 +970,7 @@ class Visualizer:
                 print("Insufficient data variation for Allocation Size Vs Time Heatmap plot.")
                 return
 
-            plt.figure(figsize=(12, 8))
+            self._figure(figsize=(12, 8))
             im = plt.imshow(heatmap_data, cmap='YlGnBu', aspect='auto', interpolation='nearest')
             plt.colorbar(im, label='Number of Allocations')
             plt.title('Allocation Size vs. Time Heatmap', fontsize=14, fontweight='bold')
@@ -520,16 +979,15 @@ class Visualizer:
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Allocation size vs. time heatmap saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Allocation size vs. time heatmap')
             else:
                 plt.show(block=True)
                 plt.close()
         except Exception as e:
             print(f"An error occurred while generating the allocation size vs. time heatmap: {e}")
 
-    def call_stack_trace_frequency(self, df: pd.DataFrame, output_path: Optional[str] = None) -> None:
+    def call_stack_trace_frequency(self, df: pd.DataFrame, output_path: Optional[str] = None,
+                                   top_n: Optional[int] = CALL_STACK_TOP_N) -> None:
         """
         Plots the frequency of allocations from each call stack.
 
@@ -539,36 +997,54 @@ class Visualizer:
             The preprocessed DataFrame containing performance data.
         output_path : Optional[str], default=None
             The file path to save the plot image. If None, the plot is displayed.
+        top_n : Optional[int], default=CALL_STACK_TOP_N
+            Plot only the top_n most frequent call stacks. If None, all call stacks are plotted.
 
         Returns
         -------
         None
         """
         try:
-            alloc_df = df[(df['Operation'] == 'Allocation') & (df['Operation'] != 'Summary')]
+            _, is_alloc = self._masks(df)
+            alloc_df = df.loc[is_alloc, ['CallStack']]
             if alloc_df.empty:
                 print("No allocation data available for Call Stack Trace Frequency plot.")
                 return
 
-            callstack_counts = alloc_df['CallStack'].value_counts().reset_index()
-            callstack_counts.columns = ['CallStack', 'AllocationCount']
+            # Counts integer codes instead of hashing every stack string; categorical columns
+            # already carry codes, anything else is factorized once
+            call_stack = alloc_df['CallStack']
+            if isinstance(call_stack.dtype, pd.CategoricalDtype):
+                codes = call_stack.cat.codes.to_numpy()
+                labels = call_stack.cat.categories
+            else:
+                codes, labels = pd.factorize(call_stack, sort=False)
+            counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+            top = np.flatnonzero(counts)
+            if top_n is not None and top_n < top.size:
+                # argpartition selects the top_n stacks in linear time before the small sort
+                top = top[np.argpartition(-counts[top], top_n - 1)[:top_n]]
+            top = top[np.argsort(-counts[top], kind='stable')]
+            # Only the drawn stacks are mapped back to their strings
+            callstack_counts = pd.DataFrame({'CallStack': np.asarray(labels.take(top)),
+                                             'AllocationCount': counts[top]})
             if callstack_counts.empty:
                 print("No call stack trace data available for Call Stack Trace Frequency plot.")
                 return
 
-            plt.figure(figsize=(12, 6))
+            self._figure(figsize=(12, 6))
             plt.bar(callstack_counts['CallStack'], callstack_counts['AllocationCount'],
                    edgecolor='black', alpha=0.7)
-            plt.title('Allocation Frequency by Call Stack Trace', fontsize=14, fontweight='bold')
+            plt.title(self._top_n_title('Allocation Frequency by Call Stack Trace', top_n,
+                                        np.count_nonzero(counts)),
+                      fontsize=14, fontweight='bold')
             plt.xlabel('Call Stack Trace', fontsize=12)
             plt.ylabel('Number of Allocations', fontsize=12)
             plt.xticks(rotation=45, ha='right')
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Call stack trace frequency plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Call stack trace frequency plot')
             else:
                 plt.show(block=True)
                 plt.close()
@@ -591,8 +1067,9 @@ class Visualizer:
         None
         """
         try:
-            # Filter summary logs
-            summary_df = df[df['Operation'] == 'Summary'].copy()
+            # Filter summary logs, keeping only the columns that carry the benchmark results
+            summary_df = df.loc[(df['Operation'] == 'Summary').to_numpy(),
+                                ['Timestamp', 'Time', 'Fragmentation', 'Source', 'CallStack']]
             if summary_df.empty:
                 print("No summary data available for Throughput Trends plot.")
                 return
@@ -614,7 +1091,7 @@ class Visualizer:
             summary_df.sort_values('Timestamp', inplace=True)
 
             # Plot Allocation Throughput Over Time
-            plt.figure(figsize=(12, 6))
+            self._figure(figsize=(12, 6))
             plt.plot(summary_df['Timestamp'], summary_df['AllocThroughput'], 
                     marker='o', label='Allocation Throughput', linewidth=2)
             plt.plot(summary_df['Timestamp'], summary_df['DeallocThroughput'], 
@@ -626,12 +1103,421 @@ class Visualizer:
             plt.tight_layout()
 
             if output_path:
-                plt.savefig(output_path)
-                print(f"Throughput trends plot saved to {os.path.abspath(output_path)}")
-                plt.close()
+                self._savefig(output_path, 'Throughput trends plot')
             else:
                 plt.show(block=True)
                 plt.close()
 
         except Exception as e:
-            print(f"An error occurred while generating the throughput trends plot: {e}")
\ No newline at end of file
+            print(f"An error occurred while generating the throughput trends plot: {e}")
+
+    def plots_from_batches(self, batches: Iterable[pa.RecordBatch], output_paths: Dict[str, str]) -> bool:
+        """
+        Generates reduction-style plots from a stream of record batches.
+
+        Each batch is folded into small accumulators (net memory change per second, a
+        power-of-two size histogram and per-source totals), so peak memory is bounded by
+        the batch size instead of the trace size.
+
+        Parameters
+        ----------
+        batches : Iterable[pa.RecordBatch]
+            Typed record batches without invalid rows, e.g. from DataLoader.iter_batches.
+        output_paths : Dict[str, str]
+            Maps the plot methods to render (any of STREAMABLE_PLOTS) to output file paths.
+
+        Returns
+        -------
+        bool
+            True if the plots were generated, False if the stream or a plot failed, in which
+            case the caller can render the plots from the loaded data instead.
+        """
+        try:
+            net_by_second = Counter()
+            size_counts = np.zeros(len(SIZE_BIN_EDGES) + 1, dtype=np.int64)
+            memory_by_source = Counter()
+            count_by_source = Counter()
+            wants_sizes = ('total_memory_usage_over_time' in output_paths
+                           or 'allocation_size_distribution' in output_paths
+                           or 'memory_usage_by_source' in output_paths)
+            wants_sources = ('memory_usage_by_source' in output_paths
+                             or 'number_of_allocations_by_source' in output_paths)
+
+            for batch in batches:
+                operation = batch.column('Operation')
+                op_codes = operation.indices.to_numpy(zero_copy_only=False)
+                op_names = operation.dictionary.to_pylist()
+                is_alloc = op_codes == (op_names.index('Allocation') if 'Allocation' in op_names else -1)
+                if wants_sizes:
+                    block_size = batch.column('BlockSize').to_numpy(zero_copy_only=False)
+
+                if 'total_memory_usage_over_time' in output_paths:
+                    # Net memory change per whole second, excluding summary logs
+                    non_summary = op_codes != (op_names.index('Summary') if 'Summary' in op_names else -1)
+                    seconds = batch.column('Timestamp').to_numpy(zero_copy_only=False)[non_summary]
+                    seconds = seconds.astype('datetime64[s]').view(np.int64)
+                    net = np.where(is_alloc[non_summary], block_size[non_summary], -block_size[non_summary])
+                    unique_seconds, inverse = np.unique(seconds, return_inverse=True)
+                    net_by_second.update(dict(zip(unique_seconds.tolist(),
+                                                  np.bincount(inverse, weights=net).tolist())))
+
+                if 'allocation_size_distribution' in output_paths:
+                    size_counts += np.bincount(np.digitize(block_size[is_alloc], SIZE_BIN_EDGES),
+                                               minlength=len(size_counts))
+
+                if wants_sources:
+                    sources = batch.column('Source').filter(pa.array(is_alloc))
+                    if not pa.types.is_dictionary(sources.type):
+                        sources = sources.dictionary_encode()
+                    # The dictionary spans the whole batch, so only the sources that occur among
+                    # the allocations are counted; missing sources are skipped, as in memory
+                    source_codes = sources.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+                    has_source = source_codes >= 0
+                    source_codes = source_codes[has_source]
+                    source_names = sources.dictionary.to_pylist()
+                    counts = np.bincount(source_codes, minlength=len(source_names))
+                    observed = np.flatnonzero(counts)
+                    observed_names = [source_names[code] for code in observed]
+                    count_by_source.update(dict(zip(observed_names, counts[observed].tolist())))
+                    if 'memory_usage_by_source' in output_paths:
+                        memory = np.bincount(source_codes, weights=block_size[is_alloc][has_source],
+                                             minlength=len(source_names))
+                        memory_by_source.update(dict(zip(observed_names, memory[observed].tolist())))
+
+            if 'total_memory_usage_over_time' in output_paths:
+                self._plot_streamed_memory_usage(net_by_second, output_paths['total_memory_usage_over_time'])
+            if 'allocation_size_distribution' in output_paths:
+                self._plot_streamed_size_distribution(size_counts, output_paths['allocation_size_distribution'])
+            if 'memory_usage_by_source' in output_paths:
+                self._plot_streamed_source_bars(
+                    dict(sorted(memory_by_source.most_common(SOURCE_TOP_N))),
+                    self._top_n_title('Total Memory Usage by Source', SOURCE_TOP_N, len(memory_by_source)),
+                    'Total Allocated Memory (bytes)', 'Memory usage by source',
+                    output_paths['memory_usage_by_source'])
+            if 'number_of_allocations_by_source' in output_paths:
+                self._plot_streamed_source_bars(
+                    dict(count_by_source.most_common(SOURCE_TOP_N)),
+                    self._top_n_title('Number of Allocations by Source', SOURCE_TOP_N, len(count_by_source)),
+                    'Number of Allocations', 'Number of allocations by source',
+                    output_paths['number_of_allocations_by_source'])
+        except Exception as e:
+            print(f"An error occurred while generating plots from streamed batches: {e}")
+            return False
+        return True
+
+    def _plot_streamed_memory_usage(self, net_by_second: Counter, output_path: str) -> None:
+        """
+        Plots total memory usage over time from per-second net memory changes.
+        """
+        if not net_by_second:
+            print("No data available for Total Memory Usage Over Time plot.")
+            return
+
+        seconds = np.fromiter(sorted(net_by_second), dtype=np.int64, count=len(net_by_second))
+        total_memory = np.cumsum([net_by_second[sec] for sec in seconds])
+        timestamps = pd.to_datetime(seconds, unit='s')
+
+        self._figure(figsize=(12, 6))
+        plt.plot(timestamps, total_memory, linewidth=2)
+        plt.title('Total Memory Usage Over Time (per second)', fontsize=14, fontweight='bold')
+        plt.xlabel('Timestamp', fontsize=12)
+        plt.ylabel('Total Allocated Memory (bytes)', fontsize=12)
+        self.set_x_limits(plt, timestamps)
+        plt.tight_layout()
+        self._savefig(output_path, 'Total memory usage plot')
+
+    def _plot_streamed_size_distribution(self, size_counts: np.ndarray, output_path: str) -> None:
+        """
+        Plots the allocation size distribution from power-of-two bin counts.
+        """
+        if not size_counts.any():
+            print("No allocation data available for Allocation Size Distribution plot.")
+            return
+
+        self._draw_size_distribution(size_counts)
+        self._savefig(output_path, 'Allocation size distribution plot')
+
+    def _draw_size_distribution(self, size_counts: np.ndarray) -> None:
+        """
+        Draws allocation size counts per SIZE_BIN_EDGES bin on a log2 size axis.
+
+        Bin i counts sizes in [edges[i-1], edges[i]); bin 0 holds sizes below one byte.
+        """
+        occupied = np.flatnonzero(size_counts)
+        edges = np.concatenate(([0.5], SIZE_BIN_EDGES, [SIZE_BIN_EDGES[-1] * 2]))
+        bins = np.arange(occupied[0], occupied[-1] + 1)
+
+        self._figure(figsize=(10, 6))
+        plt.bar(edges[bins], size_counts[bins], width=edges[bins + 1] - edges[bins], align='edge',
+                edgecolor='black', alpha=0.7)
+        plt.xscale('log', base=2)
+        plt.title('Allocation Size Distribution', fontsize=14, fontweight='bold')
+        plt.xlabel('Block Size (bytes)', fontsize=12)
+        plt.ylabel('Number of Allocations', fontsize=12)
+        plt.tight_layout()
+
+    def _plot_streamed_source_bars(self, values_by_source: Dict[str, float], title: str, ylabel: str,
+                                   description: str, output_path: str) -> None:
+        """
+        Plots a per-source bar chart from aggregated values.
+        """
+        if not values_by_source:
+            print(f"No allocation data available for {title} plot.")
+            return
+
+        self._figure(figsize=(12, 6))
+        plt.bar(list(values_by_source), list(values_by_source.values()), edgecolor='black', alpha=0.7)
+        plt.title(title, fontsize=14, fontweight='bold')
+        plt.xlabel('Source', fontsize=12)
+        plt.ylabel(ylabel, fontsize=12)
+        plt.xticks(rotation=45, ha='right')
+        plt.tight_layout()
+        self._savefig(output_path, f'{description} plot')
+
+
+class VisualizerPolars(Visualizer):
+    """
+    A Visualizer whose data preparation runs as Polars queries on a LazyFrame.
+
+    Each plot expresses its filtering, projection and aggregation as one lazy query, so
+    Polars fuses them and only the small aggregated result is materialized and handed to
+    matplotlib. Only the methods listed in POLARS_PLOTS accept a LazyFrame; the inherited
+    methods still take a pandas DataFrame.
+
+    Methods
+    -------
+    total_memory_usage_over_time(lf: pl.LazyFrame, output_path: Optional[str] = None) -> None
+        Plots total memory usage over time.
+    allocation_deallocation_rates_over_time(lf: pl.LazyFrame, interval: str = '1s',
+                                            output_path: Optional[str] = None) -> None
+        Plots allocation and deallocation rates over time.
+    memory_usage_by_source(lf: pl.LazyFrame, output_path: Optional[str] = None) -> None
+        Plots total memory usage by source (module/function/class).
+    number_of_allocations_by_source(lf: pl.LazyFrame, output_path: Optional[str] = None) -> None
+        Plots the number of allocations per source.
+    """
+
+    def __init__(self):
+        """
+        Checks that Polars is available.
+        """
+        if pl is None:
+            raise ImportError("VisualizerPolars requires the 'polars' package (pip install polars).")
+        super().__init__()
+
+    def _save_or_show(self, output_path: Optional[str], description: str) -> None:
+        """
+        Saves the current figure to output_path, or displays it if no path is given.
+        """
+        plt.tight_layout()
+        if output_path:
+            self._savefig(output_path, f'{description} plot')
+        else:
+            plt.show(block=True)
+            plt.close()
+
+    def total_memory_usage_over_time(self, lf: 'pl.LazyFrame', output_path: Optional[str] = None) -> None:
+        """
+        Plots total memory usage over time.
+
+        Parameters
+        ----------
+        lf : pl.LazyFrame
+            The cleaned performance data, e.g. from DataLoader.scan_data.
+        output_path : Optional[str], default=None
+            The file path to save the plot image. If None, the plot is displayed.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            usage = (
+                lf.select(['Timestamp', 'Operation', 'BlockSize'])
+                .filter(pl.col('Operation') != 'Summary')
+                .sort('Timestamp')
+                .select(
+                    pl.col('Timestamp'),
+                    pl.when(pl.col('Operation') == 'Allocation')
+                    .then(pl.col('BlockSize'))
+                    .otherwise(-pl.col('BlockSize'))
+                    .cum_sum()
+                    .alias('TotalMemory'),
+                )
+                .collect()
+            )
+            if usage.height == 0:
+                print("No data available for Total Memory Usage Over Time plot.")
+                return
+
+            timestamps = pd.Series(usage['Timestamp'].to_numpy())
+            total_memory = usage['TotalMemory'].to_numpy()
+            self._figure(figsize=(12, 6))
+            if usage.height > TIME_SERIES_MAX_POINTS:
+                plt.plot(*self._min_max_decimate(timestamps.to_numpy(), total_memory, TIME_SERIES_BUCKETS),
+                         linewidth=2)
+            else:
+                plt.plot(timestamps, total_memory, linewidth=2)
+            plt.title('Total Memory Usage Over Time', fontsize=14, fontweight='bold')
+            plt.xlabel('Timestamp', fontsize=12)
+            plt.ylabel('Total Allocated Memory (bytes)', fontsize=12)
+            self.set_x_limits(plt, timestamps)
+            self._save_or_show(output_path, 'Total memory usage')
+        except Exception as e:
+            print(f"An error occurred while generating the total memory usage plot: {e}")
+
+    def allocation_deallocation_rates_over_time(self, lf: 'pl.LazyFrame', interval: str = '1s',
+                                                output_path: Optional[str] = None) -> None:
+        """
+        Plots allocation and deallocation rates over time.
+
+        Parameters
+        ----------
+        lf : pl.LazyFrame
+            The cleaned performance data, e.g. from DataLoader.scan_data.
+        interval : str, default='1s'
+            Time interval for grouping (e.g., '1s' for 1 second).
+        output_path : Optional[str], default=None
+            The file path to save the plot image. If None, the plot is displayed.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            interval = interval.lower()
+            # Windows start at midnight of the first day like the pandas plot, not at the
+            # epoch-aligned boundaries of group_by_dynamic, which differ for intervals such as
+            # '7s' that do not divide a day
+            step, day = pd.Timedelta(interval).value, pd.Timedelta(days=1).value
+            ticks = pl.col('Timestamp').dt.epoch('ns')
+            origin = ticks.min() // day * day
+            counts = (
+                lf.select(['Timestamp', 'Operation'])
+                .filter(pl.col('Operation') != 'Summary')
+                .with_columns(
+                    pl.col('Operation').cast(pl.String),
+                    pl.from_epoch(origin + (ticks - origin) // step * step, time_unit='ns').alias('Timestamp'),
+                )
+                .group_by(['Timestamp', 'Operation'])
+                .agg(pl.len().alias('Count'))
+                .collect()
+            )
+            if counts.height == 0:
+                print("No data available for Allocation/Deallocation Rates Over Time plot.")
+                return
+
+            # One column per operation, with empty intervals filled in as zero counts
+            counts = (
+                counts.pivot(on='Operation', index='Timestamp', values='Count')
+                .sort('Timestamp')
+                .upsample('Timestamp', every=interval)
+                .fill_null(0)
+            )
+            if counts.height < 2:
+                print("Insufficient variation in timestamps for Allocation/Deallocation Rates Over Time plot.")
+                return
+
+            timestamps = pd.Series(counts['Timestamp'].to_numpy())
+            marker = 'o' if counts.height <= MARKER_MAX_POINTS else None
+            self._figure(figsize=(12, 6))
+            for operation in sorted(col for col in counts.columns if col != 'Timestamp'):
+                plt.plot(timestamps, counts[operation].to_numpy(), marker=marker, label=operation)
+            plt.title('Allocation and Deallocation Rates Over Time')
+            plt.xlabel('Timestamp')
+            plt.ylabel('Number of Operations')
+            plt.legend(title='Operation')
+            self.set_x_limits(plt, timestamps)
+            self._save_or_show(output_path, 'Allocation/deallocation rates')
+        except Exception as e:
+            print(f"An error occurred while generating the allocation/deallocation rates plot: {e}")
+
+    def memory_usage_by_source(self, lf: 'pl.LazyFrame', output_path: Optional[str] = None,
+                               top_n: Optional[int] = SOURCE_TOP_N) -> None:
+        """
+        Plots total memory usage by source (module/function/class).
+
+        Parameters
+        ----------
+        lf : pl.LazyFrame
+            The cleaned performance data, e.g. from DataLoader.scan_data.
+        output_path : Optional[str], default=None
+            The file path to save the plot image. If None, the plot is displayed.
+        top_n : Optional[int], default=SOURCE_TOP_N
+            Plot only the top_n sources that allocated the most memory. If None, all sources are plotted.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            memory_by_source = (
+                lf.filter(pl.col('Operation') == 'Allocation')
+                .group_by(pl.col('Source').cast(pl.String))
+                .agg(pl.col('BlockSize').sum())
+                .sort('Source')
+                .collect()
+            )
+            if memory_by_source.height == 0:
+                print("No allocation data available for Memory Usage By Source plot.")
+                return
+            n_sources = memory_by_source.height
+            if top_n is not None and top_n < n_sources:
+                memory_by_source = memory_by_source.top_k(top_n, by='BlockSize').sort('Source')
+
+            self._figure(figsize=(12, 6))
+            plt.bar(memory_by_source['Source'].to_list(), memory_by_source['BlockSize'].to_numpy(),
+                    edgecolor='black', alpha=0.7)
+            plt.title(self._top_n_title('Total Memory Usage by Source', top_n, n_sources),
+                      fontsize=14, fontweight='bold')
+            plt.xlabel('Source', fontsize=12)
+            plt.ylabel('Total Allocated Memory (bytes)', fontsize=12)
+            plt.xticks(rotation=45, ha='right')
+            self._save_or_show(output_path, 'Memory usage by source')
+        except Exception as e:
+            print(f"An error occurred while generating the memory usage by source plot: {e}")
+
+    def number_of_allocations_by_source(self, lf: 'pl.LazyFrame', output_path: Optional[str] = None,
+                                        top_n: Optional[int] = SOURCE_TOP_N) -> None:
+        """
+        Plots the number of allocations per source.
+
+        Parameters
+        ----------
+        lf : pl.LazyFrame
+            The cleaned performance data, e.g. from DataLoader.scan_data.
+        output_path : Optional[str], default=None
+            The file path to save the plot image. If None, the plot is displayed.
+        top_n : Optional[int], default=SOURCE_TOP_N
+            Plot only the top_n sources with the most allocations. If None, all sources are plotted.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            allocation_counts = (
+                lf.filter(pl.col('Operation') == 'Allocation')
+                .group_by(pl.col('Source').cast(pl.String))
+                .agg(pl.len().alias('Count'))
+                .sort('Count', descending=True)
+                .collect()
+            )
+            if allocation_counts.height == 0:
+                print("No allocation data available for Number of Allocations By Source plot.")
+                return
+            n_sources = allocation_counts.height
+            if top_n is not None:
+                allocation_counts = allocation_counts.head(top_n)
+
+            self._figure(figsize=(12, 6))
+            plt.bar(allocation_counts['Source'].to_list(), allocation_counts['Count'].to_numpy(),
+                    edgecolor='black', alpha=0.7)
+            plt.title(self._top_n_title('Number of Allocations by Source', top_n, n_sources),
+                      fontsize=14, fontweight='bold')
+            plt.xlabel('Source', fontsize=12)
+            plt.ylabel('Number of Allocations', fontsize=12)
+            plt.xticks(rotation=45, ha='right')
+            self._save_or_show(output_path, 'Number of allocations by source')
+        except Exception as e:
+            print(f"An error occurred while generating the number of allocations by source plot: {e}")
@@ -1,16 +1,171 @@
 import argparse
+import functools
+import logging
 import os
+import shutil
 import sys
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from scripts.data_loader import DataLoader
-from scripts.visualizer import Visualizer
+# Plot types accepted by --plots, in generation order, mapped to the Visualizer method that
+# draws them; each plot is saved as "<csv base name>_<method name>.png"
+PLOT_METHODS = {
+    'memory_usage_over_time': 'total_memory_usage_over_time',
+    'allocation_deallocation_rates': 'allocation_deallocation_rates_over_time',
+    'allocation_latency_over_time': 'allocation_latency_over_time',
+    'allocation_latency_percentiles': 'allocation_latency_percentiles',
+    'allocation_size_distribution': 'allocation_size_distribution',
+    'memory_usage_by_source': 'memory_usage_by_source',
+    'number_of_allocations_by_source': 'number_of_allocations_by_source',
+    'average_allocation_latency_by_source': 'average_allocation_latency_by_source',
+    'allocation_size_vs_time_heatmap': 'allocation_size_vs_time_heatmap',
+    'call_stack_trace_frequency': 'call_stack_trace_frequency',
+    'throughput_trends': 'throughput_trends',
+}
+
+# CSV columns read by each plot type; lets the lazy engine decode only what is plotted
+PLOT_COLUMNS = {
+    'memory_usage_over_time': {'Timestamp', 'Operation', 'BlockSize'},
+    'allocation_deallocation_rates': {'Timestamp', 'Operation'},
+    'allocation_latency_over_time': {'Timestamp', 'Operation', 'Time'},
+    'allocation_latency_percentiles': {'Timestamp', 'Operation', 'Time'},
+    'allocation_size_distribution': {'Operation', 'BlockSize'},
+    'memory_usage_by_source': {'Operation', 'Source', 'BlockSize'},
+    'number_of_allocations_by_source': {'Operation', 'Source'},
+    'average_allocation_latency_by_source': {'Operation', 'Source', 'Time'},
+    'allocation_size_vs_time_heatmap': {'Timestamp', 'Operation', 'BlockSize'},
+    'call_stack_trace_frequency': {'Operation', 'CallStack'},
+    'throughput_trends': {'Timestamp', 'Operation', 'Time', 'Fragmentation', 'Source', 'CallStack'},
+}
+
+
+def _configure_libraries() -> None:
+    """
+    Imports and configures matplotlib, pyplot and pandas for rendering.
+
+    pandas, matplotlib and the project modules take most of a second to import, so they
+    are only imported once there is work to do; --help and early exits skip them. Also
+    runs as the initializer of the worker processes.
+    """
+    import matplotlib
+    import pandas as pd
+
+    # Plots are only ever written to files, so the GUI backends are never needed
+    matplotlib.use('Agg')
+
+    # Importing pyplot loads the font cache; in the worker processes this happens at startup,
+    # while the main process is still loading the first CSV, instead of in the first task
+    import matplotlib.pyplot  # noqa: F401
+
+    # Copy-on-write turns the defensive copies in the load/preprocess/plot chain into lazy views,
+    # and inferred strings are Arrow-backed instead of Python objects
+    pd.set_option('mode.copy_on_write', True)
+    pd.set_option('future.infer_string', True)
+
+
+def _readable(plot_type: str) -> str:
+    """
+    Returns the display name of a plot type, e.g. "Memory Usage Over Time".
+    """
+    return plot_type.replace('_', ' ').title()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_snapshot(snapshot_path: str):
+    """
+    Loads the shared DataFrame snapshot once per worker process.
+    """
+    from scripts.data_loader import DataLoader
+    return DataLoader.read_parquet(snapshot_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _worker_visualizer():
+    """
+    Returns the Visualizer of the worker process.
+
+    Reusing one instance lets consecutive plots of the same snapshot share its PreparedData,
+    since _read_snapshot hands every task of that snapshot the same DataFrame.
+    """
+    from scripts.visualizer import Visualizer
+    return Visualizer()
+
+
+def _render_plot(snapshot_path: str, method_name: str, output_path: str) -> None:
+    """
+    Renders a single plot in a worker process.
+
+    Parameters
+    ----------
+    snapshot_path : str
+        Path to the Parquet snapshot of the preprocessed DataFrame.
+    method_name : str
+        Name of the Visualizer method to call.
+    output_path : str
+        The file path to save the plot image.
+    """
+    viz = _worker_visualizer()
+    getattr(viz, method_name)(_read_snapshot(snapshot_path), output_path=output_path)
+    viz.flush()
+
+
+def submit_plots(executor: ProcessPoolExecutor, df, tasks: List[Tuple[str, str]],
+                 snapshot_path: str, write_snapshot: bool = True) -> Dict[Future, str]:
+    """
+    Queues independent plots of one DataFrame on a shared process pool.
+
+    Workers read the DataFrame back from a Parquet snapshot, which is much cheaper than
+    pickling it for every task.
+
+    Parameters
+    ----------
+    executor : ProcessPoolExecutor
+        The pool shared by all CSV files.
+    df : pd.DataFrame
+        The preprocessed DataFrame.
+    tasks : List[Tuple[str, str]]
+        (Visualizer method name, output path) pairs.
+    snapshot_path : str
+        The Parquet snapshot path; it must outlive the queued tasks and not change meanwhile.
+    write_snapshot : bool, default=True
+        Whether to write df to snapshot_path first. Pass False when snapshot_path already
+        holds the same frame, e.g. as a link made by DataLoader.link_cache.
+
+    Returns
+    -------
+    Dict[Future, str]
+        The queued tasks, mapped to their output paths.
+    """
+    if write_snapshot:
+        df.to_parquet(snapshot_path, engine='pyarrow')
+    return {
+        executor.submit(_render_plot, snapshot_path, method_name, output_path): output_path
+        for method_name, output_path in tasks
+    }
+
+
+def wait_for_plots(futures: Dict[Future, str]) -> None:
+    """
+    Waits for queued plots and reports the ones that failed.
+
+    Parameters
+    ----------
+    futures : Dict[Future, str]
+        Queued tasks mapped to their output paths, as returned by submit_plots.
+    """
+    for future in as_completed(futures):
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Failed to render '{futures[future]}': {e}")
+
 
 def main():
     """
@@ -44,44 +199,79 @@ def main():
     parser.add_argument(
         '-p', '--plots',
         nargs='+',
-        choices=[
-            'memory_usage_over_time',
-            'allocation_deallocation_rates',
-            'allocation_latency_over_time',
-            'allocation_latency_percentiles',
-            'allocation_size_distribution',
-            'memory_usage_by_source',
-            'number_of_allocations_by_source',
-            'average_allocation_latency_by_source',
-            'allocation_size_vs_time_heatmap',
-            'call_stack_trace_frequency',
-            'throughput_trends',
-            'all'
-        ],
+        choices=[*PLOT_METHODS, 'all'],
         default=['all'],
         help='Types of plots to generate. Choose from the list or select "all" for all plots.'
     )
+    parser.add_argument(
+        '--engine',
+        choices=['pandas', 'polars'],
+        default='pandas',
+        help='Data loading engine. "polars" runs a lazy query that only parses the columns '
+             'needed by the requested plots and computes the aggregation-style plots with Polars '
+             '(requires the polars package). Defaults to "pandas".'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Compute reduction-style plots (memory usage over time per second, size distribution, '
+             'per-source totals) batch by batch instead of loading whole CSV files into memory.'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Number of worker processes used to render plots. Defaults to one per requested plot, '
+             'up to the number of CPUs; use 1 to render sequentially.'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=os.path.join(os.path.expanduser('~'), '.cache', 'memviz'),
+        help='Directory for Parquet caches of preprocessed CSV data. Defaults to "~/.cache/memviz".'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-parse the CSV files instead of using or writing the Parquet cache.'
+    )
+    parser.add_argument(
+        '--log-level',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        default='INFO',
+        type=str.upper,
+        help='Verbosity of the data loading messages. Use "WARNING" to keep only problems. '
+             'Defaults to "INFO".'
+    )
 
     args = parser.parse_args()
+    logging.basicConfig(level=args.log_level, format='%(message)s')
 
     # Determine which CSV files to use
     if args.input:
-        csv_files = args.input
-        print(f"User provided {len(csv_files)} CSV file(s) for processing.")
+        print(f"User provided {len(args.input)} CSV file(s) for processing.")
+        csv_files = []
+        for csv_file in args.input:
+            if os.path.exists(csv_file):
+                csv_files.append(csv_file)
+            else:
+                print(f"CSV file '{csv_file}' does not exist. Skipping.")
     else:
-        # Look for CSV files in reports directory
+        # Look for CSV files in reports directory; scandir yields names and file types in
+        # one pass, so the files found need no further existence checks
         reports_dir = "reports"
-        if os.path.exists(reports_dir):
-            csv_files = [os.path.join(reports_dir, f) for f in os.listdir(reports_dir) 
-                        if f.endswith('.csv')]
-            if csv_files:
-                print(f"No input files provided. Found {len(csv_files)} CSV file(s) in reports/ directory.")
-            else:
-                print("No input CSV files provided and no CSV files found in reports/ directory. Exiting.")
-                return
-        else:
+        try:
+            with os.scandir(reports_dir) as entries:
+                csv_files = [entry.path for entry in entries
+                             if entry.name.endswith('.csv') and entry.is_file()]
+        except FileNotFoundError:
             print("No input CSV files provided and reports/ directory not found. Exiting.")
             return
+        if csv_files:
+            print(f"No input files provided. Found {len(csv_files)} CSV file(s) in reports/ directory.")
+        else:
+            print("No input CSV files provided and no CSV files found in reports/ directory. Exiting.")
+            return
 
     # Validate and create output directory if needed
     output_dir = os.path.abspath(args.output)
@@ -91,118 +281,124 @@ def main():
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         output_dir = os.path.join(output_dir, timestamp)
     try:
+        Path(output_dir).mkdir(parents=True)
+        print(f"Created output directory at: {output_dir}")
+    except FileExistsError:
         if not os.path.isdir(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
-            print(f"Created output directory at: {output_dir}")
-        else:
-            print(f"Using existing output directory at: {output_dir}")
+            print(f"Error creating output directory '{output_dir}': a file with that name exists")
+            return
+        print(f"Using existing output directory at: {output_dir}")
     except Exception as e:
         print(f"Error creating output directory '{output_dir}': {e}")
         return
 
+    _configure_libraries()
+    from scripts.data_loader import DataLoader
+    from scripts.visualizer import POLARS_PLOTS, STREAMABLE_PLOTS, Visualizer, VisualizerPolars
+
     # Initialize Visualizer
     viz = Visualizer()
 
     # Determine plots to generate
-    plots_to_generate = args.plots
-    if 'all' in plots_to_generate:
-        plots_to_generate = [
-            'memory_usage_over_time',
-            'allocation_deallocation_rates',
-            'allocation_latency_over_time',
-            'allocation_latency_percentiles',
-            'allocation_size_distribution',
-            'memory_usage_by_source',
-            'number_of_allocations_by_source',
-            'average_allocation_latency_by_source',
-            'allocation_size_vs_time_heatmap',
-            'call_stack_trace_frequency',
-            'throughput_trends'
-        ]
-
-    # Mapping of plot types to Visualizer methods and output filenames
-    plot_methods = {
-        'memory_usage_over_time': {
-            'method': viz.total_memory_usage_over_time,
-            'filename': 'total_memory_usage_over_time.png'
-        },
-        'allocation_deallocation_rates': {
-            'method': viz.allocation_deallocation_rates_over_time,
-            'filename': 'allocation_deallocation_rates_over_time.png'
-        },
-        'allocation_latency_over_time': {
-            'method': viz.allocation_latency_over_time,
-            'filename': 'allocation_latency_over_time.png'
-        },
-        'allocation_latency_percentiles': {
-            'method': viz.allocation_latency_percentiles,
-            'filename': 'allocation_latency_percentiles.png'
-        },
-        'allocation_size_distribution': {
-            'method': viz.allocation_size_distribution,
-            'filename': 'allocation_size_distribution.png'
-        },
-        'memory_usage_by_source': {
-            'method': viz.memory_usage_by_source,
-            'filename': 'memory_usage_by_source.png'
-        },
-        'number_of_allocations_by_source': {
-            'method': viz.number_of_allocations_by_source,
-            'filename': 'number_of_allocations_by_source.png'
-        },
-        'average_allocation_latency_by_source': {
-            'method': viz.average_allocation_latency_by_source,
-            'filename': 'average_allocation_latency_by_source.png'
-        },
-        'allocation_size_vs_time_heatmap': {
-            'method': viz.allocation_size_vs_time_heatmap,
-            'filename': 'allocation_size_vs_time_heatmap.png'
-        },
-        'call_stack_trace_frequency': {
-            'method': viz.call_stack_trace_frequency,
-            'filename': 'call_stack_trace_frequency.png'
-        },
-        'throughput_trends': {
-            'method': viz.throughput_trends,
-            'filename': 'throughput_trends.png'
-        }
-    }
+    plots_to_generate = list(PLOT_METHODS) if 'all' in args.plots else args.plots
 
-    # Iterate over each CSV file
-    for csv_file in csv_files:
-        if not os.path.exists(csv_file):
-            print(f"CSV file '{csv_file}' does not exist. Skipping.")
-            continue
-
-        print(f"\nProcessing CSV file: {csv_file}")
-
-        # Load and preprocess data
-        loader = DataLoader(csv_file)
-        df = loader.load_data()
-        if df is None or df.empty:
-            print(f"No data loaded from '{csv_file}'. Skipping.")
-            continue
-        df = loader.preprocess_data(df)
-        if df is None or df.empty:
-            print(f"Data preprocessing resulted in an empty DataFrame for '{csv_file}'. Skipping.")
-            continue
-
-        # Extract base name without extension for plot naming
-        base_name = os.path.splitext(os.path.basename(csv_file))[0]
-
-        # Generate plots based on user input
-        for plot_type in plots_to_generate:
-            if plot_type in plot_methods:
-                method = plot_methods[plot_type]['method']
-                filename = plot_methods[plot_type]['filename']
-                # Prefix the plot filename with the CSV base name to avoid conflicts
-                prefixed_filename = f"{base_name}_{filename}"
-                output_path = os.path.join(output_dir, prefixed_filename)
-                readable_plot_name = plot_type.replace('_', ' ').title()
-                print(f"Generating plot: {readable_plot_name} -> {prefixed_filename}")
-                method(df, output_path=output_path)
+    # Columns needed by the requested plots
+    columns_needed = set().union(*(PLOT_COLUMNS[p] for p in plots_to_generate))
+
+    # One process pool renders the plots of every CSV file, so the plots of one file are
+    # drawn while the next file is loaded
+    n_plots = len(csv_files) * len(plots_to_generate)
+    max_workers = args.jobs or min(n_plots, os.cpu_count() or 1)
+    executor = None
+    if max_workers > 1 and n_plots > 1:
+        executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_configure_libraries)
+    snapshot_dir = tempfile.mkdtemp(prefix='memviz-') if executor is not None else None
+    futures = {}
+    try:
+        # Iterate over each CSV file
+        for index, csv_file in enumerate(csv_files):
+            print(f"\nProcessing CSV file: {csv_file}")
+
+            # Extract base name without extension for plot naming
+            base_name = os.path.splitext(os.path.basename(csv_file))[0]
+
+            # Prefix the plot filenames with the CSV base name to avoid conflicts
+            output_paths = {
+                plot_type: os.path.join(output_dir, f"{base_name}_{PLOT_METHODS[plot_type]}.png")
+                for plot_type in plots_to_generate
+            }
+
+            loader = DataLoader(csv_file, cache_dir=None if args.no_cache else args.cache_dir)
+
+            # Stream reduction-style plots without materializing the DataFrame
+            remaining_plots = plots_to_generate
+            if args.stream:
+                streamed = [p for p in plots_to_generate if PLOT_METHODS[p] in STREAMABLE_PLOTS]
+                if streamed:
+                    print(f"Streaming plots: {', '.join(_readable(p) for p in streamed)}")
+                    stream_columns = set().union(*(PLOT_COLUMNS[p] for p in streamed))
+                    if viz.plots_from_batches(loader.iter_batches(stream_columns),
+                                              {PLOT_METHODS[p]: output_paths[p] for p in streamed}):
+                        remaining_plots = [p for p in plots_to_generate if p not in streamed]
+                        if not remaining_plots:
+                            continue
+                    else:
+                        print("Streaming failed; generating these plots from the loaded data instead.")
+
+            # Load and preprocess data
+            if args.engine == 'polars':
+                frame = loader.collect_frame(columns_needed)
+                if frame is None or frame.height == 0:
+                    print(f"No data loaded from '{csv_file}'. Skipping.")
+                    continue
+
+                # Aggregation-style plots run as fused Polars queries on the collected frame
+                polars_plots = [p for p in remaining_plots if PLOT_METHODS[p] in POLARS_PLOTS]
+                if polars_plots:
+                    polars_viz = VisualizerPolars()
+                    for plot_type in polars_plots:
+                        output_path = output_paths[plot_type]
+                        print(f"Generating plot: {_readable(plot_type)} -> {os.path.basename(output_path)}")
+                        getattr(polars_viz, PLOT_METHODS[plot_type])(frame.lazy(), output_path=output_path)
+                    polars_viz.flush()
+                    remaining_plots = [p for p in remaining_plots if p not in polars_plots]
+                    if not remaining_plots:
+                        continue
+                df = DataLoader.frame_to_pandas(frame)
             else:
-                print(f"Plot type '{plot_type}' is not recognized and will be skipped.")
+                df = loader.load_preprocessed(columns_needed)
+                if df is None:
+                    print(f"No data loaded from '{csv_file}'. Skipping.")
+                    continue
+                if df.empty:
+                    print(f"Data preprocessing resulted in an empty DataFrame for '{csv_file}'. Skipping.")
+                    continue
+
+            # Queue the plots on the shared pool and move on to the next file
+            if executor is not None:
+                tasks = [(PLOT_METHODS[p], output_paths[p]) for p in remaining_plots]
+                print(f"Generating {len(tasks)} plots with {max_workers} worker processes")
+                # Each CSV gets a private snapshot, so later rewrites of the shared cache cannot
+                # change what queued tasks read; a hard link to the up-to-date cache avoids
+                # writing the frame again (--no-cache, the Polars engine or a failed link do)
+                snapshot_path = os.path.join(snapshot_dir, f'{index}.parquet')
+                write_snapshot = not (args.engine == 'pandas'
+                                      and loader.link_cache(columns_needed, snapshot_path))
+                futures.update(submit_plots(executor, df, tasks, snapshot_path, write_snapshot))
+                continue
+
+            # Generate plots based on user input
+            for plot_type in remaining_plots:
+                output_path = output_paths[plot_type]
+                print(f"Generating plot: {_readable(plot_type)} -> {os.path.basename(output_path)}")
+                getattr(viz, PLOT_METHODS[plot_type])(df, output_path=output_path)
+
+        viz.flush()
+        wait_for_plots(futures)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
 
     print("\nAll requested plots have been generated.")
 
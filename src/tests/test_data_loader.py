@@ -0,0 +1,174 @@
+"""
+Tests for scripts.data_loader: the CSV parser fallbacks, the Parquet cache and streaming.
+
+Run from the repository root with ``python -m unittest discover -s src/tests``.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from scripts.data_loader import DataLoader, _coerce_numeric, _load_preprocessed_memoized
+
+# Written by DataLogger (src/logger/data_logger.cpp): 60 allocation/deallocation rows and
+# two logSummary rows, which end with a trailing comma and so have 11 fields.
+DATALOGGER_CSV = os.path.join(os.path.dirname(__file__), 'data', 'datalogger_sample.csv')
+
+HEADER = 'Timestamp,Operation,BlockSize,Time,Fragmentation,Source,CallStack,MemoryAddress,ThreadID,AllocationID\n'
+
+CLEAN_ROWS = (
+    '2025-10-10 12:00:00,Allocation,64,0.5,1.5,main,f1;f2,0x1,1,1\n'
+    '2025-10-10 12:00:01,Allocation,128,0.25,2.5,io,f1,0x2,1,2\n'
+    '2025-10-10 12:00:02,Deallocation,64,0.125,1.0,main,f1;f2,0x1,1,1\n'
+)
+
+
+class CsvTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix='memviz-test-')
+        _load_preprocessed_memoized.cache_clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write_csv(self, body: str, name: str = 'trace.csv') -> str:
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w') as f:
+            f.write(HEADER + body)
+        return path
+
+
+class ParserFallbackTest(CsvTestCase):
+    def test_typed_reader(self):
+        df = DataLoader(self.write_csv(CLEAN_ROWS)).load_preprocessed()
+        self.assertEqual(len(df), 3)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['Timestamp']))
+        self.assertTrue(pd.api.types.is_integer_dtype(df['BlockSize']))
+        self.assertIsInstance(df.index, pd.RangeIndex)
+
+    def test_lenient_reader_drops_malformed_values(self):
+        path = self.write_csv(CLEAN_ROWS
+                              + '2025-10-10 12:00:03,Allocation,oops,0.5,1.5,main,f1,0x3,1,3\n'
+                              + 'not a time,Allocation,32,0.5,1.5,main,f1,0x4,1,4\n'
+                              + '2025-10-10 12:00:05,Allocation,32,inf,1.5,main,f1,0x5,1,5\n')
+        df = DataLoader(path).load_preprocessed()
+        self.assertEqual(df['AllocationID'].tolist(), ['1', '2', '1'])
+        self.assertIsInstance(df.index, pd.RangeIndex)
+
+    def test_pandas_fallback_for_malformed_rows(self):
+        # A short row defeats both Arrow readers; pandas pads it with missing values
+        path = self.write_csv(CLEAN_ROWS + '2025-10-10 12:00:03,Allocation,64\n')
+        df = DataLoader(path).load_preprocessed({'Timestamp', 'Operation', 'BlockSize', 'Time'})
+        self.assertEqual(len(df), 3)
+
+    def test_datalogger_file_without_column_selection(self):
+        df = DataLoader(DATALOGGER_CSV).load_preprocessed()
+        self.assertEqual(len(df), 62)
+        self.assertEqual((df['Operation'] == 'Summary').sum(), 2)
+
+    def test_column_pruning_changes_dropped_rows(self):
+        path = self.write_csv(CLEAN_ROWS + 'not a time,Allocation,32,0.5,1.5,main,f1,0x4,1,4\n')
+        self.assertEqual(len(DataLoader(path).load_preprocessed({'Operation', 'CallStack'})), 4)
+        self.assertEqual(len(DataLoader(path).load_preprocessed()), 3)
+
+    def test_empty_column_selection_is_rejected(self):
+        loader = DataLoader(self.write_csv(CLEAN_ROWS))
+        with self.assertLogs('scripts.data_loader', 'ERROR'):
+            self.assertIsNone(loader.load_data(set()))
+        with self.assertRaises(ValueError):
+            list(loader.iter_batches({'NotAColumn'}))
+
+    def test_float_parser_matches_python(self):
+        values = ['1.5', ' -2.25 ', '+3', '1e-3', '6.02E23', '0.000002551', '.5', '5.',
+                  '123456789012345678901', 'abc', '', '1.5.2', '1e', '-']
+        parsed = _coerce_numeric(pd.Series(values + [None], dtype='string[pyarrow]'))
+        parsed = parsed.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        def expected(value):
+            try:
+                return float(value)
+            except ValueError:
+                return np.nan
+
+        np.testing.assert_allclose(parsed, [expected(v) for v in values] + [np.nan], rtol=1e-12)
+
+
+class CacheTest(CsvTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.csv_path = self.write_csv(CLEAN_ROWS)
+
+    def load(self, columns=None) -> pd.DataFrame:
+        _load_preprocessed_memoized.cache_clear()
+        return DataLoader(self.csv_path, self.cache_dir).load_preprocessed(columns)
+
+    def test_second_load_hits_cache(self):
+        first = self.load()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        with self.assertLogs('scripts.data_loader', 'INFO') as logs:
+            second = self.load()
+        self.assertTrue(any('from cache' in line for line in logs.output))
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_changed_csv_overwrites_cache(self):
+        self.load()
+        with open(self.csv_path, 'a') as f:
+            f.write('2025-10-10 12:00:03,Allocation,256,0.5,1.5,io,f1,0x3,1,3\n')
+        st = os.stat(self.csv_path)
+        os.utime(self.csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        self.assertEqual(len(self.load()), 4)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_column_selection_overwrites_cache(self):
+        self.load()
+        df = self.load({'Operation', 'Source'})
+        self.assertEqual(sorted(df.columns), ['Operation', 'Source'])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(len(self.load().columns), 10)
+
+    def test_link_cache_survives_rewrite(self):
+        self.load()
+        link = os.path.join(self.tmp_dir, 'snapshot.parquet')
+        loader = DataLoader(self.csv_path, self.cache_dir)
+        self.assertTrue(loader.link_cache(None, link))
+        self.load({'Operation'})
+        self.assertEqual(len(DataLoader.read_parquet(link).columns), 10)
+        self.assertFalse(loader.link_cache(None, os.path.join(self.tmp_dir, 'stale.parquet')))
+
+
+class StreamingTest(CsvTestCase):
+    def test_streams_datalogger_summary_rows(self):
+        loader = DataLoader(DATALOGGER_CSV)
+        # A small block size spreads the file, and its summary rows, over several batches
+        batches = list(loader.iter_batches({'Timestamp', 'Operation', 'BlockSize', 'Source'},
+                                           block_size=1024))
+        self.assertGreater(len(batches), 1)
+        table = pa.Table.from_batches(batches)
+        self.assertEqual(table.num_rows, 60)
+        self.assertNotIn('Summary', table.column('Operation').to_pylist())
+
+    def test_lenient_stream_resumes_after_yielded_rows(self):
+        rows = ''.join(f'2025-10-10 12:00:{i % 60:02d},Allocation,{64 + i},0.5,1.5,main,f1,0x{i:x},1,{i}\n'
+                       for i in range(400))
+        path = self.write_csv(rows + '2025-10-10 12:01:00,Allocation,oops,0.5,1.5,main,f1,0x0,1,400\n'
+                              + '2025-10-10 12:01:01,Allocation,32,0.5,1.5,main,f1,0x0,1,401\n')
+        # Batches read leniently have float64 numerical columns, so they are not concatenated
+        with self.assertLogs('scripts.data_loader', 'WARNING'):
+            ids = [allocation_id for batch in DataLoader(path).iter_batches(block_size=4096)
+                   for allocation_id in batch.column('AllocationID').to_pylist()]
+        self.assertEqual(ids, [str(i) for i in range(400)] + ['401'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Tests for scripts.visualizer: binning, decimation and the streamed reductions.
+
+Run from the repository root with ``python -m unittest discover -s src/tests``.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+
+from scripts.data_loader import DataLoader
+from scripts.visualizer import SIZE_BIN_EDGES, Visualizer
+
+# Written by DataLogger (src/logger/data_logger.cpp), including two summary rows.
+DATALOGGER_CSV = os.path.join(os.path.dirname(__file__), 'data', 'datalogger_sample.csv')
+
+STREAMABLE_METHODS = ('total_memory_usage_over_time', 'allocation_size_distribution',
+                      'memory_usage_by_source', 'number_of_allocations_by_source')
+
+
+class UniformBinsTest(unittest.TestCase):
+    def assert_matches_histogram(self, values: np.ndarray, n_bins: int = 50):
+        # histogramdd bins each axis like histogram2d, and unlike np.histogram it accepts
+        # spans too narrow for n_bins distinct float edges
+        bins = Visualizer._uniform_bins(values, n_bins)
+        counts, _ = np.histogramdd(values[:, None], bins=n_bins)
+        np.testing.assert_array_equal(np.bincount(bins, minlength=n_bins), counts)
+
+    def test_random_values(self):
+        rng = np.random.default_rng(0)
+        self.assert_matches_histogram(rng.normal(size=10000))
+        self.assert_matches_histogram(rng.integers(1, 1 << 20, size=10000).astype(np.float64))
+
+    def test_epoch_nanoseconds(self):
+        start = float(np.datetime64('2025-10-10T12:00:00', 'ns').view(np.int64))
+        self.assert_matches_histogram(start + np.arange(0, 3e10, 7e6))
+
+    def test_degenerate_spans(self):
+        self.assert_matches_histogram(np.full(10, 42.0))
+        start = float(np.datetime64('2025-10-10T12:00:00', 'ns').view(np.int64))
+        self.assert_matches_histogram(start + np.arange(5.0) * 256)
+
+
+class MinMaxDecimateTest(unittest.TestCase):
+    def decimate(self, span_ns: int, n_buckets: int = 2000):
+        rng = np.random.default_rng(1)
+        ticks = np.sort(rng.integers(0, span_ns, size=50000))
+        times = (np.datetime64('2025-01-01', 'ns') + ticks.astype('timedelta64[ns]'))
+        y = rng.normal(size=ticks.size).cumsum()
+        return y, Visualizer._min_max_decimate(times, y, n_buckets)
+
+    def test_keeps_envelope(self):
+        y, (times, envelope) = self.decimate(60 * 10**9)
+        self.assertLessEqual(len(times), 2 * 2000)
+        self.assertTrue(times.is_monotonic_increasing)
+        self.assertEqual(envelope.max(), y.max())
+        self.assertEqual(envelope.min(), y.min())
+
+    def test_long_span_does_not_overflow(self):
+        # ticks * n_buckets would exceed int64 for spans over about 53 days
+        y, (times, envelope) = self.decimate(83 * 86400 * 10**9)
+        self.assertLessEqual(len(times), 2 * 2000)
+        self.assertTrue(times.is_monotonic_increasing)
+        self.assertEqual(envelope.max(), y.max())
+        self.assertEqual(envelope.min(), y.min())
+
+
+class StreamedReductionTest(unittest.TestCase):
+    def test_streamed_reductions_match_loaded_data(self):
+        viz = Visualizer()
+        with tempfile.TemporaryDirectory() as output_dir, \
+                mock.patch.object(viz, '_plot_streamed_memory_usage') as memory_usage, \
+                mock.patch.object(viz, '_plot_streamed_size_distribution') as size_distribution, \
+                mock.patch.object(viz, '_plot_streamed_source_bars') as source_bars:
+            output_paths = {method: os.path.join(output_dir, f'{method}.png') for method in STREAMABLE_METHODS}
+            batches = DataLoader(DATALOGGER_CSV).iter_batches(block_size=1024)
+            self.assertTrue(viz.plots_from_batches(batches, output_paths))
+
+        df = DataLoader(DATALOGGER_CSV).load_preprocessed()
+        rows = df[df['Operation'] != 'Summary']
+        allocs = rows[rows['Operation'] == 'Allocation']
+
+        signed = rows['BlockSize'].where(rows['Operation'] == 'Allocation', -rows['BlockSize'])
+        net = signed.groupby(rows['Timestamp'].dt.floor('s')).sum()
+        streamed_net = memory_usage.call_args.args[0]
+        self.assertEqual({np.datetime64(sec, 's'): value for sec, value in streamed_net.items()},
+                         {np.datetime64(ts, 's'): value for ts, value in net.items()})
+
+        expected_sizes = np.bincount(np.digitize(allocs['BlockSize'], SIZE_BIN_EDGES),
+                                     minlength=len(SIZE_BIN_EDGES) + 1)
+        np.testing.assert_array_equal(size_distribution.call_args.args[0], expected_sizes)
+
+        memory_by_source, count_by_source = (call.args[0] for call in source_bars.call_args_list)
+        self.assertEqual(memory_by_source,
+                         allocs.groupby('Source', observed=True)['BlockSize'].sum().to_dict())
+        self.assertEqual(count_by_source, allocs.groupby('Source', observed=True).size().to_dict())
+
+    def test_streamed_plots_are_written(self):
+        viz = Visualizer()
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_paths = {method: os.path.join(output_dir, f'{method}.png') for method in STREAMABLE_METHODS}
+            self.assertTrue(viz.plots_from_batches(DataLoader(DATALOGGER_CSV).iter_batches(), output_paths))
+            viz.flush()
+            for path in output_paths.values():
+                self.assertTrue(os.path.exists(path), path)
+
+
+if __name__ == '__main__':
+    unittest.main()